@@ -153,14 +153,8 @@ func cmdStartAll(m *manager.Manager) int {
 // cmdStopAll stops every running managed process without marking them explicitly
 // stopped, so the watch daemon respawns them (under its own signed identity).
 func cmdStopAll(m *manager.Manager) int {
-	var running []string
-	for _, info := range m.ListProcesses() {
-		if info.Running {
-			running = append(running, info.Name)
-		}
-	}
-	m.ShutdownAll()
-	fmt.Printf("Stopped %d running process(es); the watch daemon will respawn them\n", len(running))
+	stopped := m.ShutdownAll()
+	fmt.Printf("Stopped %d running process(es); the watch daemon will respawn them\n", len(stopped))
 	return 0
 }
 
@@ -12,7 +12,10 @@ import (
 
 // runWatch runs the supervision loop until interrupted. SIGTERM (sent during
 // system shutdown) triggers a clean teardown of all managed processes; SIGINT
-// just stops watching. A single bad tick never kills the supervisor.
+// just stops watching. A single bad tick never kills the supervisor. Besides
+// the one-second tick, the exit of any service this daemon spawned runs a tick
+// at once, so a crash is restarted (backoff permitting) without waiting out
+// the rest of the interval.
 func runWatch(m *manager.Manager) int {
 	disableAppNap()
 	sigCh := make(chan os.Signal, 1)
@@ -26,6 +29,8 @@ func runWatch(m *manager.Manager) int {
 			return handleWatchSignal(m, sig)
 		case <-ticker.C:
 			runTickSafely(m)
+		case <-m.ChildExits():
+			runTickSafely(m)
 		}
 	}
 }
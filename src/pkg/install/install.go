@@ -7,10 +7,14 @@
 package install
 
 import (
+	"bytes"
+	"encoding/xml"
+	"errors"
 	"fmt"
 	"os"
 	"os/exec"
 	"path/filepath"
+	"strings"
 	"time"
 
 	"auto/pkg/manager"
@@ -21,13 +25,18 @@ import (
 // whoever ran the installer.
 const daemonPATH = "/Users/darrenoakey/.local/bin:/Users/darrenoakey/bin:/opt/homebrew/bin:/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin"
 
+// daemonLANG is the LANG given to the watch daemon, fixed for the same reason.
+const daemonLANG = "en_AU.UTF-8"
+
 // AppExePath returns the path to the signed app binary inside the project tree.
 func AppExePath(root string) string {
 	return filepath.Join(root, "output", "Auto.app", "Contents", "MacOS", "auto")
 }
 
 // Install writes the wrapper and LaunchAgent and (re)loads the daemon. The app
-// bundle must already be built and signed (see `run build`).
+// bundle must already be built and signed (see `run build`). The daemon is
+// reloaded even when neither file changed: a rebuild replaces the binary behind
+// the same path, and the reload is what puts the new build in charge.
 func Install(root string) error {
 	appExe := AppExePath(root)
 	if _, err := os.Stat(appExe); err != nil {
@@ -47,6 +56,9 @@ func Install(root string) error {
 	return nil
 }
 
+// wrapperTemplate is ~/bin/auto; its one placeholder is the quoted app exe.
+const wrapperTemplate = "#!/bin/bash\nexec %q \"$@\"\n"
+
 // writeWrapper installs ~/bin/auto as a thin exec into the signed app binary so
 // CLI invocations run the same signed identity.
 func writeWrapper(appExe string) error {
@@ -58,15 +70,43 @@ func writeWrapper(appExe string) error {
 	if err := os.MkdirAll(binDir, 0o755); err != nil {
 		return err
 	}
-	content := fmt.Sprintf("#!/bin/bash\nexec %q \"$@\"\n", appExe)
+	content := fmt.Sprintf(wrapperTemplate, appExe)
 	wrapper := filepath.Join(binDir, "auto")
-	if err := os.WriteFile(wrapper, []byte(content), 0o755); err != nil {
+	written, err := installFile(wrapper, []byte(content), 0o755)
+	if err != nil {
 		return err
 	}
+	if !written {
+		fmt.Printf("Unchanged %s\n", wrapper)
+		return nil
+	}
 	fmt.Printf("Created %s\n", wrapper)
 	return nil
 }
 
+// installFile writes data to path with mode unless the file already holds
+// exactly that, reporting whether it wrote. A repeat install then rewrites
+// neither file, and the plist it left alone needs no fresh plutil lint.
+func installFile(path string, data []byte, mode os.FileMode) (bool, error) {
+	if fileHolds(path, data, mode) {
+		return false, nil
+	}
+	if _, err := manager.WriteFileAtomic(path, data, mode); err != nil {
+		return false, err
+	}
+	return true, nil
+}
+
+// fileHolds reports whether path is a regular file with exactly data and mode.
+func fileHolds(path string, data []byte, mode os.FileMode) bool {
+	info, err := os.Stat(path)
+	if err != nil || !info.Mode().IsRegular() || info.Mode().Perm() != mode || info.Size() != int64(len(data)) {
+		return false
+	}
+	existing, err := os.ReadFile(path)
+	return err == nil && bytes.Equal(existing, data)
+}
+
 // writeLaunchAgent renders and writes the daemon plist, returning its path.
 func writeLaunchAgent(root, appExe string) (string, error) {
 	logPath := filepath.Join(root, "output", "logs", "auto", "auto.log")
@@ -77,9 +117,14 @@ func writeLaunchAgent(root, appExe string) (string, error) {
 	if err := os.MkdirAll(filepath.Dir(plist), 0o755); err != nil {
 		return "", err
 	}
-	if err := os.WriteFile(plist, []byte(plistContent(appExe, logPath)), 0o644); err != nil {
+	written, err := installFile(plist, []byte(plistContent(appExe, logPath)), 0o644)
+	if err != nil {
 		return "", err
 	}
+	if !written {
+		fmt.Printf("Unchanged %s\n", plist)
+		return plist, nil
+	}
 	if out, err := exec.Command("plutil", "-lint", plist).CombinedOutput(); err != nil {
 		return "", fmt.Errorf("invalid plist: %s", out)
 	}
@@ -88,8 +133,11 @@ func writeLaunchAgent(root, appExe string) (string, error) {
 }
 
 // plistTemplate is the LaunchAgent plist. The daemon runs in the Aqua session so
-// its children share the GUI session's Local Network context. Substitution order:
-// label, app exe, stdout path, stderr path, PATH.
+// its children share the GUI session's Local Network context, and as an
+// Interactive job so launchd does not apply its default background CPU and I/O
+// throttling to it and to every service it spawns. Every varying value is a
+// placeholder. Substitution order: label, app exe, stdout path, stderr path,
+// PATH, LANG.
 const plistTemplate = `<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
@@ -104,39 +152,65 @@ const plistTemplate = `<?xml version="1.0" encoding="UTF-8"?>
     <key>RunAtLoad</key><true/>
     <key>KeepAlive</key><true/>
     <key>LimitLoadToSessionType</key><string>Aqua</string>
+    <key>ProcessType</key><string>Interactive</string>
     <key>StandardOutPath</key><string>%s</string>
     <key>StandardErrorPath</key><string>%s</string>
     <key>EnvironmentVariables</key>
     <dict>
         <key>PATH</key><string>%s</string>
-        <key>LANG</key><string>en_AU.UTF-8</string>
+        <key>LANG</key><string>%s</string>
     </dict>
 </dict>
 </plist>
 `
 
 // plistContent renders the LaunchAgent plist for the given binary and log path.
+// Every value is XML-escaped, so a project path containing & or < still yields
+// a valid plist.
 func plistContent(appExe, logPath string) string {
-	return fmt.Sprintf(plistTemplate, manager.LaunchAgentLabel, appExe, logPath, logPath, daemonPATH)
+	return fmt.Sprintf(plistTemplate, xmlText(manager.LaunchAgentLabel), xmlText(appExe),
+		xmlText(logPath), xmlText(logPath), xmlText(daemonPATH), xmlText(daemonLANG))
+}
+
+// xmlText escapes s for use as the character data of a plist element.
+func xmlText(s string) string {
+	var b strings.Builder
+	_ = xml.EscapeText(&b, []byte(s))
+	return b.String()
 }
 
 // reloadAgent boots out any running instance and bootstraps the agent fresh so
 // the running daemon is the just-installed binary. Bootout sends SIGTERM, which
 // routes through the daemon's own clean teardown of managed processes (a
 // launchd kickstart would SIGKILL the whole job tree instead); the fresh daemon
-// then restarts everything under its signed identity.
+// then restarts everything under its signed identity. When bootout reports the
+// agent was not loaded at all (a first install), there is nothing to wait for
+// and the `launchctl print` probe is skipped.
 func reloadAgent(plist string) error {
 	domain := fmt.Sprintf("gui/%d", os.Getuid())
 	target := domain + "/" + manager.LaunchAgentLabel
-	_ = exec.Command("launchctl", "bootout", target).Run()
-	for i := 0; i < 50; i++ {
-		if exec.Command("launchctl", "print", target).Run() != nil {
-			break
+	if !bootoutFoundNothing(exec.Command("launchctl", "bootout", target).Run()) {
+		for i := 0; i < 50; i++ {
+			if exec.Command("launchctl", "print", target).Run() != nil {
+				break
+			}
+			time.Sleep(100 * time.Millisecond)
 		}
-		time.Sleep(100 * time.Millisecond)
 	}
 	if out, err := exec.Command("launchctl", "bootstrap", domain, plist).CombinedOutput(); err != nil {
 		return fmt.Errorf("bootstrap failed: %s", out)
 	}
 	return nil
 }
+
+// launchctlNoSuchProcess is launchctl's exit status (ESRCH) when the target
+// service is not loaded.
+const launchctlNoSuchProcess = 3
+
+// bootoutFoundNothing reports whether a `launchctl bootout` result means the
+// agent was not loaded. Any other failure may leave it loaded, or unloading
+// asynchronously, so it is not taken as proof.
+func bootoutFoundNothing(err error) bool {
+	var exitErr *exec.ExitError
+	return errors.As(err, &exitErr) && exitErr.ExitCode() == launchctlNoSuchProcess
+}
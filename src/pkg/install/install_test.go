@@ -1,11 +1,14 @@
 package install
 
 import (
+	"encoding/xml"
+	"io"
 	"os"
 	"os/exec"
 	"path/filepath"
 	"strings"
 	"testing"
+	"time"
 )
 
 func TestAppExePath(t *testing.T) {
@@ -20,7 +23,7 @@ func TestPlistContentRendersAndIsValid(t *testing.T) {
 	appExe := "/Users/x/local/auto/output/Auto.app/Contents/MacOS/auto"
 	logPath := "/Users/x/local/auto/output/logs/auto/auto.log"
 	content := plistContent(appExe, logPath)
-	for _, must := range []string{appExe, logPath, "com.darrenoakey.auto", "<string>watch</string>", "LANG", daemonPATH} {
+	for _, must := range []string{appExe, logPath, "com.darrenoakey.auto", "<string>watch</string>", "LANG", daemonPATH, daemonLANG, "<key>ProcessType</key><string>Interactive</string>"} {
 		if !strings.Contains(content, must) {
 			t.Fatalf("plist missing %q:\n%s", must, content)
 		}
@@ -35,6 +38,31 @@ func TestPlistContentRendersAndIsValid(t *testing.T) {
 	}
 }
 
+func TestPlistContentEscapesPaths(t *testing.T) {
+	appExe := "/Users/x/R&D <tools>/auto/output/Auto.app/Contents/MacOS/auto"
+	content := plistContent(appExe, "/tmp/auto.log")
+	if strings.Contains(content, "R&D") {
+		t.Fatalf("plist holds an unescaped &:\n%s", content)
+	}
+	dec := xml.NewDecoder(strings.NewReader(content))
+	found := false
+	for {
+		tok, err := dec.Token()
+		if err == io.EOF {
+			break
+		}
+		if err != nil {
+			t.Fatalf("plist is not well-formed XML: %v", err)
+		}
+		if text, ok := tok.(xml.CharData); ok && string(text) == appExe {
+			found = true
+		}
+	}
+	if !found {
+		t.Fatalf("escaped plist does not decode back to %q", appExe)
+	}
+}
+
 func TestWriteWrapperExecsAppBinary(t *testing.T) {
 	home := t.TempDir()
 	t.Setenv("HOME", home)
@@ -56,9 +84,70 @@ func TestWriteWrapperExecsAppBinary(t *testing.T) {
 	}
 }
 
+func TestWriteWrapperRestoresExecutableMode(t *testing.T) {
+	home := t.TempDir()
+	t.Setenv("HOME", home)
+	wrapper := filepath.Join(home, "bin", "auto")
+	if err := os.MkdirAll(filepath.Dir(wrapper), 0o755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+	if err := os.WriteFile(wrapper, []byte("stale"), 0o600); err != nil {
+		t.Fatalf("write: %v", err)
+	}
+	if err := writeWrapper("/Users/x/local/auto/output/Auto.app/Contents/MacOS/auto"); err != nil {
+		t.Fatalf("writeWrapper: %v", err)
+	}
+	info, err := os.Stat(wrapper)
+	if err != nil || info.Mode().Perm() != 0o755 {
+		t.Fatalf("rewritten wrapper mode = %v (err %v), want 0755", info.Mode().Perm(), err)
+	}
+	entries, err := os.ReadDir(filepath.Dir(wrapper))
+	if err != nil || len(entries) != 1 {
+		t.Fatalf("install left more than the wrapper in ~/bin: %v (err %v)", entries, err)
+	}
+}
+
+func TestWriteWrapperLeavesUnchangedFileAlone(t *testing.T) {
+	home := t.TempDir()
+	t.Setenv("HOME", home)
+	appExe := "/Users/x/local/auto/output/Auto.app/Contents/MacOS/auto"
+	if err := writeWrapper(appExe); err != nil {
+		t.Fatalf("writeWrapper: %v", err)
+	}
+	wrapper := filepath.Join(home, "bin", "auto")
+	old := time.Now().Add(-time.Hour).Truncate(time.Second)
+	if err := os.Chtimes(wrapper, old, old); err != nil {
+		t.Fatalf("chtimes: %v", err)
+	}
+	if err := writeWrapper(appExe); err != nil {
+		t.Fatalf("second writeWrapper: %v", err)
+	}
+	if info, err := os.Stat(wrapper); err != nil || !info.ModTime().Equal(old) {
+		t.Fatalf("identical wrapper was rewritten (err %v)", err)
+	}
+	if err := writeWrapper(appExe + "2"); err != nil {
+		t.Fatalf("writeWrapper for a new binary: %v", err)
+	}
+	if data, _ := os.ReadFile(wrapper); !strings.Contains(string(data), appExe+"2") {
+		t.Fatalf("changed wrapper was not rewritten:\n%s", data)
+	}
+}
+
 func TestInstallFailsWithoutSignedBinary(t *testing.T) {
 	// Root with no built app: Install must refuse rather than bootstrap nothing.
 	if err := Install(t.TempDir()); err == nil {
 		t.Fatal("Install should fail when the signed binary is missing")
 	}
 }
+
+func TestBootoutFoundNothingOnlyForNotLoaded(t *testing.T) {
+	if bootoutFoundNothing(nil) {
+		t.Fatal("a successful bootout unloaded something")
+	}
+	if !bootoutFoundNothing(exec.Command("sh", "-c", "exit 3").Run()) {
+		t.Fatal("exit status 3 (no such process) means the agent was not loaded")
+	}
+	if bootoutFoundNothing(exec.Command("sh", "-c", "exit 5").Run()) {
+		t.Fatal("other bootout failures must still wait for the agent to go")
+	}
+}
@@ -25,22 +25,26 @@ func restartJitter(name string) int {
 // int64, which previously wrapped to a tiny value and defeated the cap entirely.
 const maxBackoffExp = 9
 
-// restartBackoff returns the exponential backoff for a process based on its
+// restartBackoffTable holds the capped backoff for each attempt count below
+// maxBackoffExp, computed once rather than per service per tick.
+var restartBackoffTable = func() [maxBackoffExp]time.Duration {
+	var table [maxBackoffExp]time.Duration
+	for attempt := range table {
+		table[attempt] = min(time.Duration(1<<uint(attempt))*time.Second, MaxRestartBackoff)
+	}
+	return table
+}()
+
+// restartBackoffOf returns the exponential backoff for a process based on its
 // consecutive restart-attempt count, capped at MaxRestartBackoff.
-func (m *Manager) restartBackoff(name string) time.Duration {
-	data := m.loadStateFile()
-	p, ok := data.Processes[name]
-	if !ok {
+func restartBackoffOf(p *Process) time.Duration {
+	if p == nil {
 		return time.Second
 	}
 	if p.RestartAttempt >= maxBackoffExp || p.RestartAttempt < 0 {
 		return MaxRestartBackoff
 	}
-	backoff := time.Duration(1<<uint(p.RestartAttempt)) * time.Second
-	if backoff > MaxRestartBackoff {
-		return MaxRestartBackoff
-	}
-	return backoff
+	return restartBackoffTable[p.RestartAttempt]
 }
 
 // incrementRestartAttempt bumps the restart counter and records the attempt time.
@@ -52,53 +56,74 @@ func (m *Manager) incrementRestartAttempt(name string) {
 	})
 }
 
-// resetRestartAttempt clears the restart counter after a successful start.
+// resetRestartAttempt clears the restart counter after a successful start. A
+// counter that is already clear is left alone without rewriting state.
 func (m *Manager) resetRestartAttempt(name string) {
-	m.mutateProcess(name, func(p *Process) {
-		p.RestartAttempt = 0
-		p.LastRestartTime = nil
-	})
+	m.resetBackoffs([]string{name})
 }
 
-// shouldRestart decides whether a dead, non-explicitly-stopped process is past
-// its backoff window and may be restarted.
-func (m *Manager) shouldRestart(name string) bool {
-	if m.isExplicitlyStopped(name) {
+// backoffIsClear reports whether p has no restart bookkeeping to reset.
+func backoffIsClear(p *Process) bool {
+	return p.RestartAttempt == 0 && p.LastRestartTime == nil
+}
+
+// shouldRestartEntry decides whether a dead, non-explicitly-stopped process is
+// past its backoff window and may be restarted. It takes the entry already read
+// from state, so the watch loop answers every question about a service from one
+// lookup.
+func (m *Manager) shouldRestartEntry(name string, p *Process) bool {
+	if p != nil && p.ExplicitlyStopped {
 		return false
 	}
-	if _, alive := m.processStatus(name); alive {
+	if _, alive := m.liveStatus(p); alive {
 		return false
 	}
-	data := m.loadStateFile()
-	p, ok := data.Processes[name]
 	// A start already in flight owns this process: its pid is not recorded yet,
 	// so the entry reads dead, but starting it again would spawn a second copy.
-	if ok && startClaimIsLive(p) {
+	if p != nil && startClaimIsLive(p) {
 		return false
 	}
-	if !ok || p.LastRestartTime == nil {
+	if p == nil || p.LastRestartTime == nil {
 		return true
 	}
-	backoff := m.restartBackoff(name) + time.Duration(restartJitter(name))*time.Second
+	backoff := restartBackoffOf(p) + time.Duration(restartJitter(name))*time.Second
 	elapsed := time.Duration((nowUnix() - *p.LastRestartTime) * float64(time.Second))
 	return elapsed >= backoff
 }
 
-// checkAndResetBackoff resets the backoff once a process has been running stably
-// past SuccessfulStartThreshold. It does a lock-free pre-check first so the common
-// case (no outstanding backoff) takes no lock.
-func (m *Manager) checkAndResetBackoff(name string) {
-	data := m.loadStateFile()
-	p, ok := data.Processes[name]
-	if !ok || p.RestartAttempt == 0 || p.LastRestartTime == nil {
-		return
+// backoffResetDueOf reports whether an entry already read from state carries
+// outstanding backoff that has aged past SuccessfulStartThreshold. It is the
+// lock-free pre-check before resetBackoffs, so the common case (no outstanding
+// backoff) takes no lock.
+func backoffResetDueOf(p *Process) bool {
+	if p == nil || p.RestartAttempt == 0 || p.LastRestartTime == nil {
+		return false
 	}
 	elapsed := time.Duration((nowUnix() - *p.LastRestartTime) * float64(time.Second))
-	if elapsed < SuccessfulStartThreshold {
+	return elapsed >= SuccessfulStartThreshold
+}
+
+// resetBackoffs clears the restart counters of every named process in a single
+// locked transaction. The watch loop collects all services that became stable
+// during a tick and commits them together, so a fleet recovering at once costs
+// one state rewrite rather than one per service. Names no longer present are
+// skipped, never recreated, and a transaction that finds every counter already
+// clear writes nothing.
+func (m *Manager) resetBackoffs(names []string) {
+	if len(names) == 0 {
 		return
 	}
-	m.mutateProcess(name, func(p *Process) {
-		p.RestartAttempt = 0
-		p.LastRestartTime = nil
+	m.withState(func(data *stateFile) bool {
+		changed := false
+		for _, name := range names {
+			p, ok := data.Processes[name]
+			if !ok || backoffIsClear(p) {
+				continue
+			}
+			p.RestartAttempt = 0
+			p.LastRestartTime = nil
+			changed = true
+		}
+		return changed
 	})
 }
@@ -1,6 +1,7 @@
 package manager
 
 import (
+	"os"
 	"testing"
 	"time"
 )
@@ -18,8 +19,6 @@ func TestRestartJitterDeterministicInRange(t *testing.T) {
 }
 
 func TestRestartBackoffExponentialAndCapped(t *testing.T) {
-	m := newTestManager(t)
-	mustAdd(t, m, "svc", "sleep 1", nil)
 	tests := []struct {
 		attempt int
 		want    time.Duration
@@ -35,8 +34,7 @@ func TestRestartBackoffExponentialAndCapped(t *testing.T) {
 		{62, MaxRestartBackoff},
 	}
 	for _, tt := range tests {
-		setRuntime(t, m, "svc", func(p *Process) { p.RestartAttempt = tt.attempt })
-		if got := m.restartBackoff("svc"); got != tt.want {
+		if got := restartBackoffOf(&Process{RestartAttempt: tt.attempt}); got != tt.want {
 			t.Errorf("attempt %d: backoff = %v, want %v", tt.attempt, got, tt.want)
 		}
 	}
@@ -46,32 +44,25 @@ func TestShouldRestartRespectsStateAndBackoff(t *testing.T) {
 	m := newTestManager(t)
 	mustAdd(t, m, "svc", "sleep 1", nil)
 
-	if !m.shouldRestart("svc") {
+	if !m.shouldRestartEntry("svc", m.loadStateFile().Processes["svc"]) {
 		t.Fatal("dead, never-attempted process should restart")
 	}
-	setRuntime(t, m, "svc", func(p *Process) { p.ExplicitlyStopped = true })
-	if m.shouldRestart("svc") {
+	// The remaining decisions depend only on the entry, so they are made from
+	// in-memory entries rather than round-tripping each through state.json.
+	if m.shouldRestartEntry("svc", &Process{Command: "sleep 1", ExplicitlyStopped: true}) {
 		t.Fatal("explicitly stopped process must not restart")
 	}
-	setRuntime(t, m, "svc", func(p *Process) {
-		p.ExplicitlyStopped = false
-		p.RestartAttempt = 5
-		now := nowUnix()
-		p.LastRestartTime = &now
-	})
-	if m.shouldRestart("svc") {
+	now := nowUnix()
+	if m.shouldRestartEntry("svc", &Process{Command: "sleep 1", RestartAttempt: 5, LastRestartTime: &now}) {
 		t.Fatal("recent restart within backoff must not restart")
 	}
-	setRuntime(t, m, "svc", func(p *Process) {
-		old := nowUnix() - 100000
-		p.LastRestartTime = &old
-	})
-	if !m.shouldRestart("svc") {
+	old := now - 100000
+	if !m.shouldRestartEntry("svc", &Process{Command: "sleep 1", RestartAttempt: 5, LastRestartTime: &old}) {
 		t.Fatal("backoff long elapsed should allow restart")
 	}
 }
 
-func TestCheckAndResetBackoffClearsAfterStability(t *testing.T) {
+func TestResetBackoffsClearsAfterStability(t *testing.T) {
 	m := newTestManager(t)
 	mustAdd(t, m, "svc", "sleep 1", nil)
 	setRuntime(t, m, "svc", func(p *Process) {
@@ -79,7 +70,10 @@ func TestCheckAndResetBackoffClearsAfterStability(t *testing.T) {
 		old := nowUnix() - float64(SuccessfulStartThreshold/time.Second) - 5
 		p.LastRestartTime = &old
 	})
-	m.checkAndResetBackoff("svc")
+	if !backoffResetDueOf(m.loadStateFile().Processes["svc"]) {
+		t.Fatal("backoff aged past SuccessfulStartThreshold should be due for reset")
+	}
+	m.resetBackoffs([]string{"svc"})
 	data := m.loadStateFile()
 	if data.Processes["svc"].RestartAttempt != 0 || data.Processes["svc"].LastRestartTime != nil {
 		t.Fatalf("backoff not reset: %+v", data.Processes["svc"])
@@ -97,3 +91,47 @@ func setRuntime(t *testing.T, m *Manager, name string, mutate func(*Process)) {
 	mutate(p)
 	m.saveStateFile(data)
 }
+
+func TestResetBackoffsClearsAllNamedInOneWrite(t *testing.T) {
+	m := newTestManager(t)
+	mustAdd(t, m, "a", "sleep 1", nil)
+	mustAdd(t, m, "b", "sleep 1", nil)
+	for _, name := range []string{"a", "b"} {
+		setRuntime(t, m, name, func(p *Process) {
+			p.RestartAttempt = 3
+			now := nowUnix()
+			p.LastRestartTime = &now
+		})
+	}
+	m.resetBackoffs([]string{"a", "b", "ghost"})
+	data := m.loadStateFile()
+	for _, name := range []string{"a", "b"} {
+		if p := data.Processes[name]; p.RestartAttempt != 0 || p.LastRestartTime != nil {
+			t.Fatalf("%s backoff not reset: %+v", name, p)
+		}
+	}
+	if _, ok := data.Processes["ghost"]; ok {
+		t.Fatal("resetBackoffs must not create entries for unknown names")
+	}
+}
+
+// TestResetOfClearBackoffLeavesStateUntouched pins that resetting a counter
+// that is already clear, the steady state of a healthy service, does not
+// rewrite state.json.
+func TestResetOfClearBackoffLeavesStateUntouched(t *testing.T) {
+	m := newTestManager(t)
+	mustAdd(t, m, "svc", "sleep 1", nil)
+	old := time.Now().Add(-time.Hour).Truncate(time.Second)
+	if err := os.Chtimes(m.statePath(), old, old); err != nil {
+		t.Fatalf("chtimes: %v", err)
+	}
+	m.resetRestartAttempt("svc")
+	m.resetBackoffs([]string{"svc"})
+	st, err := os.Stat(m.statePath())
+	if err != nil {
+		t.Fatalf("stat: %v", err)
+	}
+	if !st.ModTime().Equal(old) {
+		t.Fatalf("state rewritten for an already clear backoff: mtime %v, want %v", st.ModTime(), old)
+	}
+}
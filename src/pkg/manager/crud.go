@@ -107,7 +107,11 @@ func (m *Manager) RemoveProcess(name string) error {
 // real definitions — skipping runtime-only stub entries. This mirrors the
 // original load_config, which silently ignored entries without a command.
 func (m *Manager) definedNames() []string {
-	data := m.loadStateFile()
+	return definedNamesIn(m.loadStateFile())
+}
+
+// definedNamesIn is definedNames over an already-loaded state.
+func definedNamesIn(data *stateFile) []string {
 	names := make([]string, 0, len(data.Processes))
 	for name, p := range data.Processes {
 		if p.Command != "" {
@@ -118,24 +122,29 @@ func (m *Manager) definedNames() []string {
 	return names
 }
 
-// ListProcesses returns display snapshots for all configured processes.
+// ListProcesses returns display snapshots for all configured processes. The
+// state is loaded once and every entry is read from that one snapshot, and one
+// process-table snapshot answers every liveness check, so `auto ps` forks a
+// single `ps` however many services are configured.
 func (m *Manager) ListProcesses() []ProcessInfo {
 	data := m.loadStateFile()
 	infos := make([]ProcessInfo, 0, len(data.Processes))
-	for _, name := range m.definedNames() {
-		p := data.Processes[name]
-		pid, running := m.processStatus(name)
-		infos = append(infos, ProcessInfo{
-			Name:              name,
-			Command:           p.Command,
-			Pid:               pid,
-			Running:           running,
-			Port:              p.Port,
-			Workdir:           p.Workdir,
-			ExplicitlyStopped: p.ExplicitlyStopped,
-			RestartInterval:   p.RestartIntervalSeconds,
-		})
-	}
+	m.withProcSnapshot(func() {
+		for _, name := range definedNamesIn(data) {
+			p := data.Processes[name]
+			pid, running := m.liveStatus(p)
+			infos = append(infos, ProcessInfo{
+				Name:              name,
+				Command:           p.Command,
+				Pid:               pid,
+				Running:           running,
+				Port:              p.Port,
+				Workdir:           p.Workdir,
+				ExplicitlyStopped: p.ExplicitlyStopped,
+				RestartInterval:   p.RestartIntervalSeconds,
+			})
+		}
+	})
 	return infos
 }
 
@@ -20,12 +20,16 @@ var lstartLayouts = []string{
 }
 
 // isProcessAlive reports whether a process with the given pid is running and is
-// not a zombie. macOS has no /proc, so liveness is confirmed with signal 0 and
-// the zombie check is done via ps.
+// not a zombie. macOS has no /proc; the kernel's kinfo_proc record answers both
+// questions in one sysctl (kernelProcStatus). Where that is unavailable,
+// liveness is confirmed with signal 0 and the zombie check is done via ps.
 func isProcessAlive(pid int) bool {
 	if pid <= 0 {
 		return false
 	}
+	if _, alive, ok := kernelProcStatus(pid); ok {
+		return alive
+	}
 	err := syscall.Kill(pid, 0)
 	if err != nil && !errors.Is(err, syscall.EPERM) {
 		return false
@@ -41,9 +45,16 @@ func isProcessAlive(pid int) bool {
 	return state != "Z" && state != "Z+"
 }
 
-// processStartTime returns the start-time string for a pid (as ps reports it),
-// or "" if the process is gone.
+// processStartTime returns the start-time string for a pid in a ps lstart
+// layout, or "" if the process is gone. On darwin the kernel is asked directly
+// (see kernelStartTime); `ps` is the fallback everywhere else.
 func processStartTime(pid int) string {
+	if pid <= 0 {
+		return ""
+	}
+	if st, ok := kernelStartTime(pid); ok {
+		return st
+	}
 	out, err := exec.Command("ps", "-p", strconv.Itoa(pid), "-o", "lstart=").Output()
 	if err != nil {
 		return ""
@@ -89,10 +100,24 @@ func isOurProcess(pid int, expectedStartTime *string) bool {
 //
 // The residual imprecision is unchanged from the pre-snapshot code: a process
 // that dies mid-tick is noticed on the next tick rather than this one.
+//
+// The per-pid check reads liveness and start time from one kernel record where
+// the platform offers it (kernelProcStatus), instead of a liveness probe
+// followed by a separate start-time lookup. A Manager's own unreaped children
+// skip even that (see Manager.isOurPid).
 func isOurProcessVia(table *procTable, pid int, expectedStartTime *string) bool {
 	if table != nil && snapshotIsOurProcess(table, pid, expectedStartTime) {
 		return true
 	}
+	if pid <= 0 {
+		return false
+	}
+	if lstart, alive, ok := kernelProcStatus(pid); ok {
+		if !alive || expectedStartTime == nil || lstart == "" {
+			return false
+		}
+		return startTimesMatch(lstart, *expectedStartTime)
+	}
 	if !isProcessAlive(pid) {
 		return false
 	}
@@ -106,6 +131,24 @@ func isOurProcessVia(table *procTable, pid int, expectedStartTime *string) bool
 	return startTimesMatch(actual, *expectedStartTime)
 }
 
+// isOurPid is isOurProcessVia against the current tick's snapshot, except that
+// a pid that is this Manager's own unreaped child needs no lookup at all once
+// recordStarted has noted its start time (liveChildStartTime). That start time
+// is still compared with the recorded one, because a live child proves only
+// that the pid is alive, not that it is the process this entry recorded.
+func (m *Manager) isOurPid(pid int, expectedStartTime *string) bool {
+	if lstart, ok := m.liveChildStartTime(pid); ok {
+		return expectedStartTime != nil && startTimesMatch(lstart, *expectedStartTime)
+	}
+	return isOurProcessVia(m.snapshotProcs(), pid, expectedStartTime)
+}
+
+// isAlive is isProcessAlive, answered without a lookup for this Manager's own
+// unreaped children.
+func (m *Manager) isAlive(pid int) bool {
+	return m.isLiveChild(pid) || isProcessAlive(pid)
+}
+
 // snapshotIsOurProcess answers isOurProcess from a process-table snapshot,
 // applying the same alive / not-zombie / start-time-matches rules as the
 // per-pid `ps` path. A pid absent from a valid snapshot is genuinely gone.
@@ -128,8 +171,13 @@ func snapshotIsOurProcess(table *procTable, pid int, expectedStartTime *string)
 
 // startTimesMatch compares two `ps` lstart strings, parsing both when possible
 // so locale differences in layout do not cause a false mismatch, and falling
-// back to an exact string compare when either side is unparseable.
+// back to an exact string compare when either side is unparseable. Identical
+// strings, the case on every check of a service this same binary recorded,
+// match without being parsed at all.
 func startTimesMatch(actual, expected string) bool {
+	if actual == expected {
+		return true
+	}
 	actualDt, aok := parseLstartTime(actual)
 	expectedDt, eok := parseLstartTime(expected)
 	if !eok || !aok {
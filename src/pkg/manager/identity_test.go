@@ -3,7 +3,10 @@ package manager
 import (
 	"os"
 	"os/exec"
+	"strconv"
+	"strings"
 	"testing"
+	"time"
 )
 
 func TestParseLstartTimeLocaleVariants(t *testing.T) {
@@ -17,6 +20,18 @@ func TestParseLstartTimeLocaleVariants(t *testing.T) {
 	}
 }
 
+func TestStartTimesMatchAcrossLocales(t *testing.T) {
+	if !startTimesMatch("Wed Jun 18 11:33:09 2026", "Wed Jun 18 11:33:09 2026") {
+		t.Fatal("identical start times must match")
+	}
+	if !startTimesMatch("Wed Jun 18 11:33:09 2026", "Wed 18 Jun 11:33:09 2026") {
+		t.Fatal("the same instant in US and AU layouts must match")
+	}
+	if startTimesMatch("Wed Jun 18 11:33:09 2026", "Wed Jun 18 11:33:10 2026") {
+		t.Fatal("different start times must not match")
+	}
+}
+
 func TestParseLstartTimeEmptyFails(t *testing.T) {
 	if _, ok := parseLstartTime(""); ok {
 		t.Fatal("empty string should not parse")
@@ -56,3 +71,96 @@ func TestIsOurProcessMatchesStartTime(t *testing.T) {
 		t.Fatal("nil start time should be treated as stale")
 	}
 }
+
+// TestKernelStartTimeAgreesWithPs pins that the kernel fast path reports the
+// same start instant `ps -o lstart=` does, so start times recorded by either
+// path keep matching each other across an upgrade.
+func TestKernelStartTimeAgreesWithPs(t *testing.T) {
+	self := os.Getpid()
+	kernel, ok := kernelStartTime(self)
+	if !ok {
+		t.Skip("no kernel start-time fast path on this platform")
+	}
+	out, err := exec.Command("ps", "-p", strconv.Itoa(self), "-o", "lstart=").Output()
+	if err != nil {
+		t.Fatalf("ps lstart: %v", err)
+	}
+	if viaPs := strings.TrimSpace(string(out)); !startTimesMatch(kernel, viaPs) {
+		t.Fatalf("kernel start time %q does not match ps lstart %q", kernel, viaPs)
+	}
+	if gone, ok := kernelStartTime(reapedPID(t)); ok && gone != "" {
+		t.Fatalf("reaped pid reported start time %q", gone)
+	}
+}
+
+// TestKernelProcStatusMatchesSeparateChecks pins that the single kernel read
+// agrees with the separate liveness and start-time lookups it replaces.
+func TestKernelProcStatusMatchesSeparateChecks(t *testing.T) {
+	self := os.Getpid()
+	lstart, alive, ok := kernelProcStatus(self)
+	if !ok {
+		t.Skip("no kernel process-status fast path on this platform")
+	}
+	if !alive || !startTimesMatch(lstart, processStartTime(self)) {
+		t.Fatalf("kernelProcStatus(self) = (%q, %v), want alive with start %q", lstart, alive, processStartTime(self))
+	}
+	if _, alive, _ := kernelProcStatus(reapedPID(t)); alive {
+		t.Fatal("reaped pid reported alive")
+	}
+}
+
+// TestLiveChildTrackedUntilReaped pins that a reaped-in-background child counts
+// as alive only until it exits, after which liveness falls back to the kernel.
+func TestLiveChildTrackedUntilReaped(t *testing.T) {
+	m := newTestManager(t)
+	cmd := exec.Command("sleep", "30")
+	if err := cmd.Start(); err != nil {
+		t.Fatalf("start sleep: %v", err)
+	}
+	pid := cmd.Process.Pid
+	m.reapWhenDone(pid)
+	if !m.isLiveChild(pid) || !m.isAlive(pid) {
+		t.Fatal("running child should be tracked as alive")
+	}
+	if newTestManager(t).isLiveChild(pid) {
+		t.Fatal("another Manager must not count this Manager's child as its own")
+	}
+	_ = cmd.Process.Kill()
+	if !pollUntil(5*time.Second, func() bool { return !m.isLiveChild(pid) }) {
+		t.Fatal("child still tracked after it was killed and reaped")
+	}
+	if m.isAlive(pid) {
+		t.Fatal("reaped child should be dead")
+	}
+}
+
+// TestLiveChildStillNeedsStartTimeMatch pins that being this process's live
+// child proves only that the pid is alive: an entry whose recorded start time
+// belongs to some earlier process with the same pid is not ours.
+func TestLiveChildStillNeedsStartTimeMatch(t *testing.T) {
+	m := newTestManager(t)
+	cmd := exec.Command("sleep", "30")
+	if err := cmd.Start(); err != nil {
+		t.Fatalf("start sleep: %v", err)
+	}
+	pid := cmd.Process.Pid
+	m.reapWhenDone(pid)
+	defer func() { _ = cmd.Process.Kill() }()
+	actual := processStartTime(pid)
+	if actual == "" {
+		t.Skip("cannot read child start time")
+	}
+	m.setLiveChildStartTime(pid, actual) // as recordStarted does
+	stale := "Mon Jan  1 00:00:00 2001"
+	if m.isOurPid(pid, &stale) {
+		t.Fatal("live child with a stale recorded start time reported as ours")
+	}
+	m.withProcSnapshot(func() {
+		if m.isOurPid(pid, &stale) {
+			t.Error("live child with a stale recorded start time reported as ours under a snapshot")
+		}
+	})
+	if !m.isOurPid(pid, &actual) {
+		t.Fatal("live child with its own start time should be ours")
+	}
+}
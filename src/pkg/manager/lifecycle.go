@@ -18,11 +18,34 @@ var afterPortCheckHook func(port int)
 // this check and its own bind), spawnWithRetry forces the port free again and
 // retries within this same call so the caller sees a single converged start.
 func (m *Manager) StartProcess(name string) (int, error) {
-	def, ok := m.definition(name)
-	if !ok {
+	return m.startProcess(name, nil, false)
+}
+
+// startProcess is StartProcess. Callers that have just read the service's
+// entry (the supervision loops) pass it as def, and the definition and the
+// already-running check are answered from it rather than from another state
+// lookup; a nil def is looked up. With countAttempt it also records a restart
+// attempt for backoff, as the watch loop's restarts do, folded into the start
+// claim's state write rather than a transaction of its own: a restart costs
+// two state rewrites (claim, pid) instead of three.
+func (m *Manager) startProcess(name string, def *Process, countAttempt bool) (int, error) {
+	counted := false
+	if countAttempt {
+		// An attempt that fails before its claim lands still counts, or a port
+		// that never frees would be retried on every tick with no backoff.
+		defer func() {
+			if !counted {
+				m.incrementRestartAttempt(name)
+			}
+		}()
+	}
+	if def == nil {
+		def, _ = m.definition(name)
+	}
+	if def == nil || def.Command == "" {
 		return 0, fmt.Errorf("process %s not found in config", name)
 	}
-	if pid, alive := m.processStatus(name); alive {
+	if pid, alive := m.liveStatus(def); alive {
 		return 0, fmt.Errorf("process %s is already running with pid %d", name, pid)
 	}
 	if def.Port != nil && !isPortFree(*def.Port) && !forceFreePort(*def.Port) {
@@ -38,9 +61,10 @@ func (m *Manager) StartProcess(name string) (int, error) {
 	// competing copy (observed: `auto add` and the watch loop each spawning one
 	// canary, orphaning the CLI's). Both read state only through the lock, so
 	// once this write lands the loop can never see an unclaimed dead entry.
-	if !m.claimStart(name) {
+	if !m.claimStartCounting(name, countAttempt) {
 		return 0, fmt.Errorf("process %s is already starting", name)
 	}
+	counted = countAttempt
 	pid, logPath, err := m.spawnWithRetry(name, def.Command, def.Workdir, def.Port)
 	if err != nil {
 		m.clearStartClaim(name)
@@ -58,9 +82,10 @@ func (m *Manager) StartProcess(name string) (int, error) {
 // (SpawnRetryAttempts * SpawnRetryBaseDelay * attempts + SpawnVerifyDelay).
 const StartInFlightTTL = 60 * time.Second
 
-// claimStart records that a start is in flight, returning false if another
-// start already holds a live claim.
-func (m *Manager) claimStart(name string) bool {
+// claimStartCounting records that a start is in flight, returning false if
+// another start already holds a live claim. When countAttempt is set it also
+// counts a restart attempt in the same write (see startProcess).
+func (m *Manager) claimStartCounting(name string, countAttempt bool) bool {
 	claimed := false
 	m.withState(func(data *stateFile) bool {
 		p, ok := data.Processes[name]
@@ -69,6 +94,10 @@ func (m *Manager) claimStart(name string) bool {
 		}
 		now := nowUnix()
 		p.StartingSince = &now
+		if countAttempt {
+			p.RestartAttempt++
+			p.LastRestartTime = &now
+		}
 		claimed = true
 		return true
 	})
@@ -100,6 +129,7 @@ func startClaimIsLive(p *Process) bool {
 // Later lookups in the tick fall back to querying `ps` directly.
 func (m *Manager) recordStarted(name string, pid int, logPath string) {
 	st := processStartTime(pid)
+	m.setLiveChildStartTime(pid, st)
 	m.setProcSnapshot(nil)
 	m.mutateProcess(name, func(p *Process) {
 		p.Pid = &pid
@@ -120,16 +150,25 @@ func (m *Manager) definition(name string) (*Process, bool) {
 	return p, true
 }
 
-// waitForProcessDeath polls until a pid is gone or the timeout elapses.
-func waitForProcessDeath(pid int, timeout time.Duration) bool {
-	deadline := time.Now().Add(timeout)
-	for time.Now().Before(deadline) {
-		if !isProcessAlive(pid) {
+// waitForProcessDeath waits until a pid is gone or the timeout elapses. For the
+// Manager's own children it blocks on the reaper (childReaped); where the
+// kernel can report process exit (kqueue, see waitForExitEvent) the wait wakes
+// the moment the process dies; otherwise it polls.
+func (m *Manager) waitForProcessDeath(pid int, timeout time.Duration) bool {
+	if reaped, ok := m.childReaped(pid); ok {
+		timer := time.NewTimer(timeout)
+		defer timer.Stop()
+		select {
+		case <-reaped:
 			return true
+		case <-timer.C:
+			return false
 		}
-		time.Sleep(100 * time.Millisecond)
 	}
-	return !isProcessAlive(pid)
+	if dead, ok := waitForExitEvent(pid, timeout); ok {
+		return dead || !isProcessAlive(pid)
+	}
+	return pollUntil(timeout, func() bool { return !isProcessAlive(pid) })
 }
 
 // StopProcess terminates a running process group (SIGTERM then SIGKILL) and, by
@@ -184,13 +223,13 @@ func (m *Manager) terminateProcessGroup(name string, pid, pgid int) error {
 // escalateKill waits for SIGTERM to take effect, escalating to SIGKILL and
 // erroring only if the process survives both.
 func (m *Manager) escalateKill(name string, pid, pgid int) error {
-	if waitForProcessDeath(pid, SigtermTimeout) {
+	if m.waitForProcessDeath(pid, SigtermTimeout) {
 		return nil
 	}
 	if err := syscall.Kill(-pgid, syscall.SIGKILL); err != nil {
 		return fmt.Errorf("failed to SIGKILL process %s with pid %d: %w", name, pid, err)
 	}
-	if !waitForProcessDeath(pid, SigkillTimeout) {
+	if !m.waitForProcessDeath(pid, SigkillTimeout) {
 		return fmt.Errorf("process %s with pid %d survived both SIGTERM and SIGKILL", name, pid)
 	}
 	return nil
@@ -241,12 +280,12 @@ func (m *Manager) obliterateProcess(name string, pid int, markExplicit bool) err
 	if err := m.StopProcess(name, markExplicit); err != nil {
 		return err
 	}
-	if !isProcessAlive(pid) {
+	if !m.isAlive(pid) {
 		return nil
 	}
 	killProcessGroup(pid, syscall.SIGKILL)
 	_ = syscall.Kill(pid, syscall.SIGKILL)
-	if !waitForProcessDeath(pid, SigkillTimeout) {
+	if !m.waitForProcessDeath(pid, SigkillTimeout) {
 		return fmt.Errorf("process %s (pid %d) cannot be killed", name, pid)
 	}
 	return nil
@@ -9,6 +9,7 @@ import (
 )
 
 func TestStartAndStopProcess(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "sleeper", "sleep 300", nil)
 	pid, err := m.StartProcess("sleeper")
@@ -29,12 +30,13 @@ func TestStartAndStopProcess(t *testing.T) {
 	if isProcessAlive(pid) {
 		t.Fatalf("pid %d should be dead after stop", pid)
 	}
-	if !m.isExplicitlyStopped("sleeper") {
+	if !m.loadStateFile().Processes["sleeper"].ExplicitlyStopped {
 		t.Fatal("should be marked explicitly stopped")
 	}
 }
 
 func TestStartProcessAlreadyRunningFails(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "sleeper", "sleep 300", nil)
 	if _, err := m.StartProcess("sleeper"); err != nil {
@@ -54,6 +56,7 @@ func TestStartProcessUnknownFails(t *testing.T) {
 }
 
 func TestStopProcessDeadRegisteredServicePersistsExplicitStop(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "sleeper", "sleep 300", nil)
 	pid, err := m.StartProcess("sleeper")
@@ -114,6 +117,7 @@ func waitForActualProcessDeath(t *testing.T, pid int) {
 }
 
 func TestRestartProcessGivesNewPid(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "sleeper", "sleep 300", nil)
 	first, err := m.StartProcess("sleeper")
@@ -134,7 +138,7 @@ func TestRestartProcessGivesNewPid(t *testing.T) {
 	if !isProcessAlive(second) {
 		t.Fatalf("new pid %d should be alive", second)
 	}
-	if m.isExplicitlyStopped("sleeper") {
+	if m.loadStateFile().Processes["sleeper"].ExplicitlyStopped {
 		t.Fatal("restarted process must not be marked explicitly stopped")
 	}
 }
@@ -145,6 +149,7 @@ func TestRestartProcessGivesNewPid(t *testing.T) {
 // "dead and not explicitly stopped" and race a competing respawn into the gap
 // while this call is still tearing the old instance down.
 func TestStopProcessMarksExplicitBeforeKilling(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "sleeper", "sleep 300", nil)
 	pid, err := m.StartProcess("sleeper")
@@ -159,7 +164,7 @@ func TestStopProcessMarksExplicitBeforeKilling(t *testing.T) {
 			time.Sleep(time.Millisecond)
 		}
 		// pid just went dead: the explicit-stop flag must already be set.
-		done <- m.isExplicitlyStopped("sleeper")
+		done <- m.loadStateFile().Processes["sleeper"].ExplicitlyStopped
 	}()
 
 	if err := m.StopProcess("sleeper", true); err != nil {
@@ -224,3 +229,52 @@ func TestRestartProcessNotRacedByWatchTick(t *testing.T) {
 		t.Fatalf("state should track the single survivor, got (%d,%v)", pid, alive)
 	}
 }
+
+// TestWaitForProcessDeathWakesOnExit pins that the wait returns as soon as the
+// process dies rather than running out its timeout, and that an already-gone
+// pid is reported dead at once.
+func TestWaitForProcessDeathWakesOnExit(t *testing.T) {
+	t.Parallel()
+	cmd := exec.Command("sleep", "0.3")
+	if err := cmd.Start(); err != nil {
+		t.Fatalf("start sleep: %v", err)
+	}
+	go func() { _ = cmd.Wait() }()
+	m := newTestManager(t)
+	start := time.Now()
+	if !m.waitForProcessDeath(cmd.Process.Pid, 10*time.Second) {
+		t.Fatal("waitForProcessDeath reported an exited child as alive")
+	}
+	if elapsed := time.Since(start); elapsed > 3*time.Second {
+		t.Fatalf("wait took %v for a 0.3s child", elapsed)
+	}
+	if !m.waitForProcessDeath(reapedPID(t), time.Second) {
+		t.Fatal("reaped pid should be reported dead")
+	}
+}
+
+// TestWaitForProcessDeathOnOwnChild pins the reaper path: a child registered
+// with reapWhenDone is waited on through its reap, not polled.
+func TestWaitForProcessDeathOnOwnChild(t *testing.T) {
+	t.Parallel()
+	cmd := exec.Command("sleep", "0.3")
+	if err := cmd.Start(); err != nil {
+		t.Fatalf("start sleep: %v", err)
+	}
+	pid := cmd.Process.Pid
+	m := newTestManager(t)
+	m.reapWhenDone(pid)
+	if m.waitForProcessDeath(pid, 10*time.Millisecond) {
+		t.Fatal("a running child was reported dead")
+	}
+	start := time.Now()
+	if !m.waitForProcessDeath(pid, 10*time.Second) {
+		t.Fatal("child exit not observed")
+	}
+	if elapsed := time.Since(start); elapsed > 3*time.Second {
+		t.Fatalf("wait took %v for a 0.3s child", elapsed)
+	}
+	if m.isLiveChild(pid) {
+		t.Fatal("reaped child still registered")
+	}
+}
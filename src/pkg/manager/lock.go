@@ -19,9 +19,11 @@ import (
 func (m *Manager) withState(mutate func(*stateFile) bool) {
 	unlock := m.lockState()
 	defer unlock()
-	data := m.loadStateFresh() // mutator: always read latest committed state, bypassing the read cache
+	data := m.stateForMutation() // mutator: always the latest committed state, never a read-path snapshot
 	if mutate(data) {
-		m.saveStateFile(data)
+		if written := m.saveStateFile(data); written != nil {
+			m.primeStateCache(data, written)
+		}
 	}
 }
 
@@ -2,6 +2,8 @@ package manager
 
 import (
 	"fmt"
+	"os"
+	"strings"
 	"sync"
 	"testing"
 )
@@ -61,3 +63,47 @@ func TestMutateProcessIgnoresUnknownName(t *testing.T) {
 		t.Fatal("mutating an unknown name created a stub entry")
 	}
 }
+
+// TestMutationAfterOwnWriteSkipsReread pins that a transaction following this
+// Manager's own write starts from that write rather than re-reading the file:
+// with the file replaced by junk under its original stat, both mutations must
+// still land on the real entry.
+func TestMutationAfterOwnWriteSkipsReread(t *testing.T) {
+	m := newTestManager(t)
+	mustAdd(t, m, "svc", "sleep 1", nil)
+	st, err := os.Stat(m.statePath())
+	if err != nil {
+		t.Fatalf("stat: %v", err)
+	}
+	junk := []byte(strings.Repeat(" ", int(st.Size())))
+	if err := os.WriteFile(m.statePath(), junk, 0o644); err != nil {
+		t.Fatalf("overwrite: %v", err)
+	}
+	if err := os.Chtimes(m.statePath(), st.ModTime(), st.ModTime()); err != nil {
+		t.Fatalf("chtimes: %v", err)
+	}
+	m.incrementRestartAttempt("svc")
+	m.incrementRestartAttempt("svc")
+	p := New(m.Root()).loadStateFile().Processes["svc"]
+	if p == nil || p.RestartAttempt != 2 || p.Command != "sleep 1" {
+		t.Fatalf("mutations did not build on the manager's own write: %+v", p)
+	}
+}
+
+// TestMutationRereadsAfterExternalWrite pins the safety half: once another
+// process replaces state.json, the next mutation must build on that write and
+// never overwrite it from the stale cached copy.
+func TestMutationRereadsAfterExternalWrite(t *testing.T) {
+	m := newTestManager(t)
+	mustAdd(t, m, "svc", "sleep 1", nil)
+	other := New(m.Root())
+	mustAdd(t, other, "added-elsewhere", "sleep 2", nil)
+	m.incrementRestartAttempt("svc")
+	data := New(m.Root()).loadStateFile()
+	if _, ok := data.Processes["added-elsewhere"]; !ok {
+		t.Fatal("a mutation from a stale cached copy wiped another manager's write")
+	}
+	if data.Processes["svc"].RestartAttempt != 1 {
+		t.Fatalf("mutation lost: %+v", data.Processes["svc"])
+	}
+}
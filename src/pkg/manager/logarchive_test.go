@@ -136,15 +136,14 @@ func TestWatchTickArchivesOldLogs(t *testing.T) {
 	yesterday := time.Now().AddDate(0, 0, -1).Format("2006-01-02")
 	oldPath := writeNamedLog(t, m, "svc", yesterday, "tick-body\n")
 	m.WatchTick()
-	deadline := time.Now().Add(2 * time.Second)
-	for time.Now().Before(deadline) {
-		if _, err := os.Stat(oldPath); os.IsNotExist(err) {
-			assertZipContains(t, oldPath+".zip", filepath.Base(oldPath), "tick-body\n")
-			return
-		}
-		time.Sleep(20 * time.Millisecond)
+	removed := pollUntil(2*time.Second, func() bool {
+		_, err := os.Stat(oldPath)
+		return os.IsNotExist(err)
+	})
+	if !removed {
+		t.Fatalf("watch archive pass did not zip %s in time", oldPath)
 	}
-	t.Fatalf("watch archive pass did not zip %s in time", oldPath)
+	assertZipContains(t, oldPath+".zip", filepath.Base(oldPath), "tick-body\n")
 }
 
 // TestWatchTickDoesNotRewalkIdleLogTree pins the CPU fix: a pass that finds no
@@ -244,17 +243,14 @@ func (m *Manager) logArchiveLastForTest() time.Time {
 // waitForArchivePass blocks until no archive pass is in flight.
 func waitForArchivePass(t *testing.T, m *Manager) {
 	t.Helper()
-	deadline := time.Now().Add(10 * time.Second)
-	for time.Now().Before(deadline) {
+	idle := pollUntil(10*time.Second, func() bool {
 		m.logArchiveMu.Lock()
-		busy := m.logArchiveBusy
-		m.logArchiveMu.Unlock()
-		if !busy {
-			return
-		}
-		time.Sleep(5 * time.Millisecond)
+		defer m.logArchiveMu.Unlock()
+		return !m.logArchiveBusy
+	})
+	if !idle {
+		t.Fatal("archive pass did not finish in time")
 	}
-	t.Fatal("archive pass did not finish in time")
 }
 
 // countPlainLogs returns how many unarchived *.log files remain under dir.
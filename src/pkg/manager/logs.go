@@ -2,6 +2,7 @@ package manager
 
 import (
 	"fmt"
+	"io/fs"
 	"os"
 	"path/filepath"
 	"sort"
@@ -10,26 +11,54 @@ import (
 
 // ensureLogMigrated records the one-time legacy-log migration marker. The live
 // tree was migrated long ago; this only guarantees the marker exists so the
-// check stays cheap and never re-moves files.
+// check stays cheap and never re-moves files. Once the marker is known to
+// exist the answer is remembered for the Manager's lifetime, so later spawns
+// skip the stat entirely.
 func (m *Manager) ensureLogMigrated() {
+	if m.logMigrated.Load() {
+		return
+	}
 	marker := filepath.Join(m.logDir(), ".migrated")
 	if _, err := os.Stat(marker); err == nil {
+		m.logMigrated.Store(true)
 		return
 	}
-	_ = os.WriteFile(marker, nil, 0o644)
+	if os.WriteFile(marker, nil, 0o644) == nil {
+		m.logMigrated.Store(true)
+	}
 }
 
 // dailyLogPath returns the log path for a process on the current date under
 // output/logs/<name>/<year>/<month>/<name>_<YYYY-MM-DD>.log. Spawns within the
-// same day share one file (appended to); a new day starts a new file.
+// same day share one file (appended to); a new day starts a new file. The
+// directory is created on the first spawn of each month and remembered (see
+// logMonthDirs); a caller that finds it gone calls forgetLogDir and retries.
 func (m *Manager) dailyLogPath(name string) string {
 	m.ensureLogMigrated()
 	now := time.Now()
 	dir := filepath.Join(m.logDir(), name, now.Format("2006"), now.Format("01"))
-	_ = os.MkdirAll(dir, 0o755)
+	m.logMonthDirsMu.Lock()
+	known := m.logMonthDirs[name] == dir
+	m.logMonthDirsMu.Unlock()
+	if !known && os.MkdirAll(dir, 0o755) == nil {
+		m.logMonthDirsMu.Lock()
+		if m.logMonthDirs == nil {
+			m.logMonthDirs = map[string]string{}
+		}
+		m.logMonthDirs[name] = dir
+		m.logMonthDirsMu.Unlock()
+	}
 	return filepath.Join(dir, fmt.Sprintf("%s_%s.log", name, now.Format("2006-01-02")))
 }
 
+// forgetLogDir drops the remembered log directory for name, so the next
+// dailyLogPath creates it again.
+func (m *Manager) forgetLogDir(name string) {
+	m.logMonthDirsMu.Lock()
+	delete(m.logMonthDirs, name)
+	m.logMonthDirsMu.Unlock()
+}
+
 // latestLogPath returns the most recent log file for a process, preferring the
 // path recorded in state and falling back to the newest file on disk.
 func (m *Manager) latestLogPath(name string) string {
@@ -39,11 +68,99 @@ func (m *Manager) latestLogPath(name string) string {
 			return p.LogPath
 		}
 	}
-	root := filepath.Join(m.logDir(), name)
+	return newestLogFile(filepath.Join(m.logDir(), name))
+}
+
+// newestLogFile finds the newest .log under a process's log root. Daily logs
+// live in <root>/YYYY/MM/, and older months are zipped away, so the newest log
+// is in the newest month that still holds one: the year and month directories
+// are visited newest-first by name and only that month's files are stat'd,
+// instead of walking and stat'ing every archive the service ever produced.
+// Only YYYY and MM directories take part, so a stray subdirectory cannot sort
+// ahead of the real months. A tree with no dated directories (pre-daily-roll
+// legacy logs) falls back to a full walk. A dated tree whose logs have all been zipped away only checks
+// root itself for undated logs: re-walking every archived month on each call
+// could find nothing the month scan had not already ruled out.
+func newestLogFile(root string) string {
+	years := datedSubdirsNewestFirst(root, 4)
+	for _, year := range years {
+		for _, month := range datedSubdirsNewestFirst(year, 2) {
+			if newest := newestLogIn(month); newest != "" {
+				return newest
+			}
+		}
+	}
+	if len(years) > 0 {
+		return newestLogIn(root)
+	}
+	return newestLogWalk(root)
+}
+
+// datedSubdirsNewestFirst returns dir's subdirectories named with exactly
+// width digits (YYYY or MM) in descending name order, which for such
+// zero-padded names is newest first.
+func datedSubdirsNewestFirst(dir string, width int) []string {
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		return nil
+	}
+	dirs := make([]string, 0, len(entries))
+	for i := len(entries) - 1; i >= 0; i-- {
+		if entries[i].IsDir() && isDigits(entries[i].Name(), width) {
+			dirs = append(dirs, filepath.Join(dir, entries[i].Name()))
+		}
+	}
+	return dirs
+}
+
+// isDigits reports whether name is exactly width ASCII digits.
+func isDigits(name string, width int) bool {
+	if len(name) != width {
+		return false
+	}
+	for i := 0; i < len(name); i++ {
+		if name[i] < '0' || name[i] > '9' {
+			return false
+		}
+	}
+	return true
+}
+
+// newestLogIn returns the most recently modified regular .log file directly
+// inside dir, or "" if there is none.
+func newestLogIn(dir string) string {
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		return ""
+	}
 	var newest string
 	var newestMod time.Time
-	_ = filepath.Walk(root, func(path string, info os.FileInfo, err error) error {
-		if err != nil || info.IsDir() || filepath.Ext(path) != ".log" {
+	for _, entry := range entries {
+		if !entry.Type().IsRegular() || filepath.Ext(entry.Name()) != ".log" {
+			continue
+		}
+		info, err := entry.Info()
+		if err != nil {
+			continue
+		}
+		if newest == "" || info.ModTime().After(newestMod) {
+			newest, newestMod = filepath.Join(dir, entry.Name()), info.ModTime()
+		}
+	}
+	return newest
+}
+
+// newestLogWalk is the exhaustive fallback: the most recently modified .log
+// anywhere under root, stat'ing only the .log files themselves.
+func newestLogWalk(root string) string {
+	var newest string
+	var newestMod time.Time
+	_ = filepath.WalkDir(root, func(path string, entry fs.DirEntry, err error) error {
+		if err != nil || entry.IsDir() || filepath.Ext(path) != ".log" {
+			return nil
+		}
+		info, err := entry.Info()
+		if err != nil {
 			return nil
 		}
 		if newest == "" || info.ModTime().After(newestMod) {
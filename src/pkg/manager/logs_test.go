@@ -69,3 +69,130 @@ func TestLatestLogPathEmptyWhenNone(t *testing.T) {
 		t.Fatalf("expected empty, got %s", got)
 	}
 }
+
+func TestEnsureLogMigratedWritesMarkerOnce(t *testing.T) {
+	m := newTestManager(t)
+	m.ensureLogMigrated()
+	marker := filepath.Join(m.logDir(), ".migrated")
+	if _, err := os.Stat(marker); err != nil {
+		t.Fatalf("marker not written: %v", err)
+	}
+	// Once observed, the marker is not re-checked: removing it behind the
+	// Manager's back must not cause a rewrite.
+	if err := os.Remove(marker); err != nil {
+		t.Fatalf("remove marker: %v", err)
+	}
+	m.ensureLogMigrated()
+	if _, err := os.Stat(marker); !os.IsNotExist(err) {
+		t.Fatalf("marker re-checked after being cached: %v", err)
+	}
+}
+
+func TestLatestLogPathFallsBackToNewestDatedLog(t *testing.T) {
+	m := newTestManager(t)
+	root := filepath.Join(m.logDir(), "svc")
+	older := filepath.Join(root, "2026", "02", "svc_2026-02-27.log")
+	newer := filepath.Join(root, "2026", "03", "svc_2026-03-01.log")
+	zipped := filepath.Join(root, "2026", "03", "svc_2026-02-28.log.zip")
+	for _, path := range []string{older, newer, zipped} {
+		if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
+			t.Fatalf("mkdir: %v", err)
+		}
+		if err := os.WriteFile(path, []byte("x"), 0o644); err != nil {
+			t.Fatalf("write: %v", err)
+		}
+	}
+	stale := time.Now().Add(-time.Hour)
+	if err := os.Chtimes(newer, stale, stale); err != nil {
+		t.Fatalf("chtimes: %v", err)
+	}
+	if got := m.latestLogPath("svc"); got != newer {
+		t.Fatalf("latestLogPath = %s, want the newest month's log %s", got, newer)
+	}
+}
+
+// TestLatestLogPathIgnoresUndatedSubdirs pins that a non-numeric subdirectory,
+// which sorts after every YYYY name, is not mistaken for the newest year or
+// month.
+func TestLatestLogPathIgnoresUndatedSubdirs(t *testing.T) {
+	m := newTestManager(t)
+	root := filepath.Join(m.logDir(), "svc")
+	dated := filepath.Join(root, "2026", "03", "svc_2026-03-01.log")
+	strays := []string{
+		filepath.Join(root, "old", "99", "svc_old.log"),
+		filepath.Join(root, "2026", "tmp", "svc_tmp.log"),
+	}
+	for _, path := range append([]string{dated}, strays...) {
+		if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
+			t.Fatalf("mkdir: %v", err)
+		}
+		if err := os.WriteFile(path, []byte("x"), 0o644); err != nil {
+			t.Fatalf("write: %v", err)
+		}
+	}
+	stale := time.Now().Add(-time.Hour)
+	if err := os.Chtimes(dated, stale, stale); err != nil {
+		t.Fatalf("chtimes: %v", err)
+	}
+	if got := m.latestLogPath("svc"); got != dated {
+		t.Fatalf("latestLogPath = %s, want the dated log %s", got, dated)
+	}
+}
+
+func TestLatestLogPathFindsUndatedLegacyLog(t *testing.T) {
+	m := newTestManager(t)
+	legacy := filepath.Join(m.logDir(), "svc", "svc_20250101_120000.log")
+	if err := os.MkdirAll(filepath.Dir(legacy), 0o755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+	if err := os.WriteFile(legacy, []byte("x"), 0o644); err != nil {
+		t.Fatalf("write: %v", err)
+	}
+	if got := m.latestLogPath("svc"); got != legacy {
+		t.Fatalf("latestLogPath = %s, want legacy %s", got, legacy)
+	}
+}
+
+// TestLatestLogPathArchivedTreeSkipsWalk pins the fully zipped case: with no
+// plain log in any dated month, only an undated log directly in the service's
+// log root is still a candidate.
+func TestLatestLogPathArchivedTreeSkipsWalk(t *testing.T) {
+	m := newTestManager(t)
+	root := filepath.Join(m.logDir(), "svc")
+	zipped := filepath.Join(root, "2026", "03", "svc_2026-03-01.log.zip")
+	if err := os.MkdirAll(filepath.Dir(zipped), 0o755); err != nil {
+		t.Fatalf("mkdir: %v", err)
+	}
+	if err := os.WriteFile(zipped, []byte("x"), 0o644); err != nil {
+		t.Fatalf("write: %v", err)
+	}
+	if got := m.latestLogPath("svc"); got != "" {
+		t.Fatalf("latestLogPath = %s, want none for a fully archived tree", got)
+	}
+	legacy := filepath.Join(root, "svc_20250101_120000.log")
+	if err := os.WriteFile(legacy, []byte("x"), 0o644); err != nil {
+		t.Fatalf("write: %v", err)
+	}
+	if got := m.latestLogPath("svc"); got != legacy {
+		t.Fatalf("latestLogPath = %s, want undated root log %s", got, legacy)
+	}
+}
+
+// TestSpawnRecreatesRemovedLogDir pins that the remembered month directory is
+// only an optimization: a spawn after the tree was removed recreates it.
+func TestSpawnRecreatesRemovedLogDir(t *testing.T) {
+	t.Parallel()
+	m := newTestManager(t)
+	_ = m.dailyLogPath("svc")
+	if err := os.RemoveAll(filepath.Join(m.logDir(), "svc")); err != nil {
+		t.Fatalf("remove: %v", err)
+	}
+	pid, logPath, _, err := m.spawnCommand("svc", "true", "")
+	if err != nil {
+		t.Fatalf("spawn after removing the log dir: %v", err)
+	}
+	m.reapWhenDone(pid)
+	if _, err := os.Stat(logPath); err != nil {
+		t.Fatalf("log file not recreated: %v", err)
+	}
+}
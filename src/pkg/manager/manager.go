@@ -7,6 +7,7 @@ import (
 	"os"
 	"path/filepath"
 	"sync"
+	"sync/atomic"
 	"time"
 )
 
@@ -62,6 +63,24 @@ var addressInUseMarkers = []string{
 type Manager struct {
 	root string
 
+	// stateFilePath and logsDir are derived from root once in New; they were
+	// rebuilt on every call, and every state read starts with statePath.
+	// logDirReady records that logsDir has been created, so logDir stops
+	// issuing a MkdirAll on each log lookup, spawn, and archive pass.
+	stateFilePath string
+	logsDir       string
+	logDirReady   atomic.Bool
+
+	// logMigrated records that the legacy-log migration marker exists, so
+	// ensureLogMigrated is a flag check rather than a stat on every spawn.
+	logMigrated atomic.Bool
+
+	// logMonthDirs maps a process name to the dated log directory dailyLogPath
+	// last created for it, so spawns within the same month skip the MkdirAll
+	// of a four-level path. A new month simply replaces the entry.
+	logMonthDirsMu sync.Mutex
+	logMonthDirs   map[string]string
+
 	// logArchiveMu guards the log-archive pass scheduling state below.
 	// logArchiveBusy prevents overlapping passes; logArchiveLast and
 	// logArchiveBacklog rate-limit them, so an idle log tree is not re-walked
@@ -78,16 +97,25 @@ type Manager struct {
 	procTableMu sync.Mutex
 	procTable   *procTable
 
+	// children is the reaper registry: every child this Manager spawned and is
+	// still reaping, keyed by pid (see liveChild in spawn.go). childExited is
+	// signalled after each reap (see ChildExits). They live on the Manager, not
+	// in package globals, so two Managers in one process (parallel tests) never
+	// answer for each other's children or steal each other's wake-ups.
+	children    sync.Map // int -> *liveChild
+	childExited chan struct{}
+
 	// stateCache memoizes the parsed state file for read-only callers. The watch
 	// loop issues many per-service reads per tick; without this cache each one
 	// re-read and re-parsed the whole file (~200 os.ReadFile+json.Unmarshal
 	// calls per second with ~50 services), which was the daemon's entire CPU
 	// footprint. The cached *stateFile is shared read-only memory: every
-	// mutation goes through withState -> loadStateFresh -> saveStateFile, and
-	// saveStateFile bumps stateCacheGen to invalidate the snapshot. A write by a
-	// concurrent CLI invocation (a separate process with its own Manager) is
-	// detected by a stat mtime/size change, so the cache self-heals within one
-	// tick.
+	// mutation goes through withState -> stateForMutation -> saveStateFile, and
+	// saveStateFile bumps stateCacheGen to invalidate the snapshot; withState
+	// then primes the cache with the state it just wrote, so its own writes
+	// never cost a read-back. A write by a concurrent CLI invocation (a
+	// separate process with its own Manager) is detected by a stat mtime/size
+	// change, so the cache self-heals within one tick.
 	stateCacheMu       sync.Mutex
 	stateCache         *stateFile
 	stateCacheExists   bool
@@ -95,11 +123,20 @@ type Manager struct {
 	stateCacheSize     int64
 	stateCacheGen      int64 // bumped on every saveStateFile (own write)
 	stateCacheSavedGen int64 // gen of the disk content the cache reflects
+	// stateCacheOwnWrite is the stat of the file this Manager wrote when the
+	// cache was primed from that write, nil when it was filled by a read. Only
+	// such a snapshot may seed a mutation (see stateForMutation).
+	stateCacheOwnWrite os.FileInfo
 }
 
 // New returns a Manager rooted at the given project directory.
 func New(root string) *Manager {
-	return &Manager{root: root}
+	return &Manager{
+		root:          root,
+		stateFilePath: filepath.Join(root, "local", "state.json"),
+		logsDir:       filepath.Join(root, "output", "logs"),
+		childExited:   make(chan struct{}, 1),
+	}
 }
 
 // Default returns a Manager rooted at the canonical ~/local/auto project tree.
@@ -118,12 +155,16 @@ func (m *Manager) Root() string {
 
 // statePath returns the path to the single state file.
 func (m *Manager) statePath() string {
-	return filepath.Join(m.root, "local", "state.json")
+	return m.stateFilePath
 }
 
-// logDir returns the directory where process logs are stored, creating it.
+// logDir returns the directory where process logs are stored, creating it on
+// first use. A failed create is retried on the next call. Callers that write
+// below it create their own subdirectories with MkdirAll, so a log tree
+// removed while the daemon runs is rebuilt where it is needed.
 func (m *Manager) logDir() string {
-	dir := filepath.Join(m.root, "output", "logs")
-	_ = os.MkdirAll(dir, 0o755)
-	return dir
+	if !m.logDirReady.Load() && os.MkdirAll(m.logsDir, 0o755) == nil {
+		m.logDirReady.Store(true)
+	}
+	return m.logsDir
 }
@@ -1,6 +1,7 @@
 package manager
 
 import (
+	"os"
 	"path/filepath"
 	"strings"
 	"testing"
@@ -36,3 +37,17 @@ func TestRootReturnsConfiguredPath(t *testing.T) {
 		t.Fatalf("Root() = %q, want %q", got, root)
 	}
 }
+
+func TestLogDirCreatedOnFirstUse(t *testing.T) {
+	m := newTestManager(t)
+	dir := m.logDir()
+	if info, err := os.Stat(dir); err != nil || !info.IsDir() {
+		t.Fatalf("logDir %q not created: %v", dir, err)
+	}
+	if !m.logDirReady.Load() {
+		t.Fatal("logDir must remember that the directory exists")
+	}
+	if m.logDir() != dir || m.statePath() != filepath.Join(m.Root(), "local", "state.json") {
+		t.Fatal("derived paths must be stable across calls")
+	}
+}
@@ -85,12 +85,10 @@ func (m *Manager) GetRestartInterval(name string) *int {
 	return nil
 }
 
-// needsPeriodicRestart reports whether a running process is due for a scheduled
-// restart.
-func (m *Manager) needsPeriodicRestart(name string) bool {
-	data := m.loadStateFile()
-	p, ok := data.Processes[name]
-	if !ok || p.RestartIntervalSeconds == nil || *p.RestartIntervalSeconds == 0 || p.Pid == nil {
+// periodicRestartDueOf reports whether a running process, given its entry
+// already read from state, is due for a scheduled restart.
+func periodicRestartDueOf(p *Process) bool {
+	if p == nil || p.RestartIntervalSeconds == nil || *p.RestartIntervalSeconds == 0 || p.Pid == nil {
 		return false
 	}
 	baseline := periodicBaseline(p)
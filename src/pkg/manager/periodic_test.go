@@ -73,7 +73,7 @@ func TestSetAndGetRestartInterval(t *testing.T) {
 	}
 }
 
-func TestNeedsPeriodicRestart(t *testing.T) {
+func TestPeriodicRestartDueOf(t *testing.T) {
 	m := newTestManager(t)
 	mustAdd(t, m, "svc", "sleep 1", nil)
 	pid := 4242
@@ -83,14 +83,14 @@ func TestNeedsPeriodicRestart(t *testing.T) {
 		recent := nowUnix()
 		p.LastPeriodicRestart = &recent
 	})
-	if m.needsPeriodicRestart("svc") {
+	if periodicRestartDueOf(m.loadStateFile().Processes["svc"]) {
 		t.Fatal("recently restarted process is not due")
 	}
 	setRuntime(t, m, "svc", func(p *Process) {
 		old := nowUnix() - 7200
 		p.LastPeriodicRestart = &old
 	})
-	if !m.needsPeriodicRestart("svc") {
+	if !periodicRestartDueOf(m.loadStateFile().Processes["svc"]) {
 		t.Fatal("process past its interval should be due")
 	}
 }
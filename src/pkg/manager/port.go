@@ -53,14 +53,7 @@ func killProcessGroup(pid int, sig syscall.Signal) bool {
 
 // waitForPortFree polls until a port is free or the timeout elapses.
 func waitForPortFree(port int, timeout time.Duration) bool {
-	deadline := time.Now().Add(timeout)
-	for time.Now().Before(deadline) {
-		if isPortFree(port) {
-			return true
-		}
-		time.Sleep(100 * time.Millisecond)
-	}
-	return isPortFree(port)
+	return pollUntil(timeout, func() bool { return isPortFree(port) })
 }
 
 // forceFreePort repeatedly kills everything on a port until it is free or the
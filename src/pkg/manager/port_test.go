@@ -76,12 +76,5 @@ func lsofPortPids(port int) []int {
 
 // waitForPortHeld polls until a port is in use or the timeout elapses.
 func waitForPortHeld(port int, timeout time.Duration) bool {
-	deadline := time.Now().Add(timeout)
-	for time.Now().Before(deadline) {
-		if !isPortFree(port) {
-			return true
-		}
-		time.Sleep(50 * time.Millisecond)
-	}
-	return !isPortFree(port)
+	return pollUntil(timeout, func() bool { return !isPortFree(port) })
 }
@@ -0,0 +1,143 @@
+//go:build darwin
+
+package manager
+
+/*
+#include <errno.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/types.h>
+#include <sys/sysctl.h>
+#include <sys/proc.h>
+
+// autoProcInfo reads pid's kinfo_proc from the kernel: the same record `ps`
+// formats its lstart and state columns from. Returns 1 and fills the outputs
+// when the process exists, 0 when there is no such pid, -1 if sysctl failed.
+static int autoProcInfo(int pid, long long *startSec, int *stat) {
+	struct kinfo_proc kp;
+	size_t len = sizeof(kp);
+	int mib[4] = {CTL_KERN, KERN_PROC, KERN_PROC_PID, pid};
+	memset(&kp, 0, sizeof(kp));
+	if (sysctl(mib, 4, &kp, &len, NULL, 0) != 0) {
+		return -1;
+	}
+	if (len == 0) {
+		return 0;
+	}
+	*startSec = (long long)kp.kp_proc.p_starttime.tv_sec;
+	*stat = (int)kp.kp_proc.p_stat;
+	return 1;
+}
+
+// autoProcList returns a malloc'd copy of every process's kinfo_proc and its
+// length in *count, or NULL if sysctl failed. The caller frees the result. The
+// table can grow between sizing the buffer and reading into it, so the buffer
+// is padded and the read retried on ENOMEM.
+static struct kinfo_proc *autoProcList(size_t *count) {
+	int mib[3] = {CTL_KERN, KERN_PROC, KERN_PROC_ALL};
+	for (int tries = 0; tries < 4; tries++) {
+		size_t len = 0;
+		if (sysctl(mib, 3, NULL, &len, NULL, 0) != 0) {
+			return NULL;
+		}
+		len += len / 8;
+		struct kinfo_proc *procs = malloc(len);
+		if (procs == NULL) {
+			return NULL;
+		}
+		if (sysctl(mib, 3, procs, &len, NULL, 0) == 0) {
+			*count = len / sizeof(struct kinfo_proc);
+			return procs;
+		}
+		free(procs);
+		if (errno != ENOMEM) {
+			return NULL;
+		}
+	}
+	return NULL;
+}
+
+// autoProcAt reads entry i of an autoProcList result: its pid is returned, its
+// start time and p_stat filled in.
+static int autoProcAt(struct kinfo_proc *procs, size_t i, long long *startSec, int *stat) {
+	*startSec = (long long)procs[i].kp_proc.p_starttime.tv_sec;
+	*stat = (int)procs[i].kp_proc.p_stat;
+	return (int)procs[i].kp_proc.p_pid;
+}
+*/
+import "C"
+
+import (
+	"time"
+	"unsafe"
+)
+
+// kernelStartTime returns pid's start time straight from the kernel, rendered
+// in the US lstart layout, so identity checks need not fork a `ps` per pid.
+// `ps -o lstart=` prints exactly this value (kinfo_proc p_starttime, whole
+// seconds, local time); only the locale layout can differ, and
+// startTimesMatch parses both sides. The second result is false when the
+// kernel could not be asked, telling the caller to fall back to `ps`; a pid
+// that does not exist yields ("", true).
+func kernelStartTime(pid int) (string, bool) {
+	lstart, _, ok := kernelProcStatus(pid)
+	return lstart, ok
+}
+
+// kernelProcStatus answers both identity questions from one kinfo_proc read:
+// pid's start time (as kernelStartTime) and whether it is alive and not a
+// zombie. The final result is false when the kernel could not be asked.
+func kernelProcStatus(pid int) (string, bool, bool) {
+	var startSec C.longlong
+	var stat C.int
+	switch C.autoProcInfo(C.int(pid), &startSec, &stat) {
+	case 1:
+		lstart := time.Unix(int64(startSec), 0).Local().Format(lstartLayouts[0])
+		return lstart, stat != C.SZOMB, true
+	case 0:
+		return "", false, true
+	default:
+		return "", false, false
+	}
+}
+
+// kernelProcTable returns the whole process table from one sysctl
+// KERN_PROC_ALL read, in the shape newProcTable builds from `ps -Ao`: a state
+// code per pid (only "Z" is ever inspected) and the start time in the US
+// lstart layout. The second result is false when the kernel could not be
+// asked, telling the caller to fall back to `ps`.
+func kernelProcTable() (map[int]procEntry, bool) {
+	var count C.size_t
+	procs := C.autoProcList(&count)
+	if procs == nil {
+		return nil, false
+	}
+	defer C.free(unsafe.Pointer(procs))
+	byPID := make(map[int]procEntry, int(count))
+	for i := C.size_t(0); i < count; i++ {
+		var startSec C.longlong
+		var stat C.int
+		pid := int(C.autoProcAt(procs, i, &startSec, &stat))
+		byPID[pid] = procEntry{
+			state:  kernelStateCode(stat),
+			lstart: time.Unix(int64(startSec), 0).Local().Format(lstartLayouts[0]),
+		}
+	}
+	return byPID, true
+}
+
+// kernelStateCode maps kinfo_proc p_stat to the leading letter `ps` shows.
+func kernelStateCode(stat C.int) string {
+	switch stat {
+	case C.SZOMB:
+		return "Z"
+	case C.SRUN:
+		return "R"
+	case C.SSTOP:
+		return "T"
+	case C.SIDL:
+		return "U"
+	default:
+		return "S"
+	}
+}
@@ -0,0 +1,18 @@
+//go:build !darwin
+
+package manager
+
+// kernelStartTime has no kernel fast path off darwin; callers use `ps`.
+func kernelStartTime(pid int) (string, bool) {
+	return "", false
+}
+
+// kernelProcStatus has no kernel fast path off darwin; callers use `ps`.
+func kernelProcStatus(pid int) (string, bool, bool) {
+	return "", false, false
+}
+
+// kernelProcTable has no kernel fast path off darwin; callers use `ps`.
+func kernelProcTable() (map[int]procEntry, bool) {
+	return nil, false
+}
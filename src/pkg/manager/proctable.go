@@ -15,7 +15,7 @@ type procEntry struct {
 }
 
 // procTable is a point-in-time snapshot of every process on the box, taken with
-// a single `ps` invocation.
+// a single kernel read on darwin or a single `ps` invocation elsewhere.
 //
 // Without it, each watch tick asked `ps` twice per managed service — once for
 // state (liveness/zombie) and once for lstart (PID-reuse defence) — so a box
@@ -32,8 +32,13 @@ type procTable struct {
 // newProcTable snapshots the process table. It returns nil if `ps` fails, and
 // every lookup on a nil table reports "unknown" so callers transparently fall
 // back to their per-pid queries — a snapshot is an optimisation, never a
-// source of truth about a process being gone.
+// source of truth about a process being gone. On darwin the table is read
+// from the kernel in one sysctl (kernelProcTable) and `ps` is only the
+// fallback, so a snapshot forks nothing.
 func newProcTable() *procTable {
+	if byPID, ok := kernelProcTable(); ok && len(byPID) > 0 {
+		return &procTable{byPID: byPID}
+	}
 	out, err := exec.Command("ps", "-Ao", "pid=,state=,lstart=").Output()
 	if err != nil {
 		return nil
@@ -98,3 +103,18 @@ func (m *Manager) setProcSnapshot(table *procTable) {
 	m.procTable = table
 	m.procTableMu.Unlock()
 }
+
+// withProcSnapshot runs fn with one process-table snapshot serving every
+// processStatus call it makes, so a pass over all managed services costs a
+// single `ps` instead of two per service. A snapshot already installed by an
+// enclosing pass is reused rather than replaced, and only the pass that
+// installed the snapshot clears it.
+func (m *Manager) withProcSnapshot(fn func()) {
+	if m.snapshotProcs() != nil {
+		fn()
+		return
+	}
+	m.setProcSnapshot(newProcTable())
+	defer m.setProcSnapshot(nil)
+	fn()
+}
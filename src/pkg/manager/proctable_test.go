@@ -9,8 +9,8 @@ import (
 )
 
 // TestProcTableSnapshotsRealProcesses pins that the snapshot is built from a
-// real `ps` and can answer for a real live process, including its lstart in the
-// same form the per-pid path records.
+// real `ps` and can answer for a real live process, including an lstart that
+// denotes the same instant the per-pid path records.
 func TestProcTableSnapshotsRealProcesses(t *testing.T) {
 	table := newProcTable()
 	if table == nil {
@@ -24,7 +24,7 @@ func TestProcTableSnapshotsRealProcesses(t *testing.T) {
 	if entry.state == "" {
 		t.Fatal("snapshot state must not be empty for a live process")
 	}
-	if entry.lstart != processStartTime(self) {
+	if !startTimesMatch(entry.lstart, processStartTime(self)) {
 		t.Fatalf("snapshot lstart %q != ps lstart %q", entry.lstart, processStartTime(self))
 	}
 }
@@ -121,6 +121,7 @@ func TestParseProcLineHandlesSpacedLstart(t *testing.T) {
 // recordStarted must drop it. Without this a single tick could start the same
 // service twice.
 func TestSpawnInvalidatesTickSnapshot(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "snap-svc", "sleep 300", nil)
 	m.setProcSnapshot(newProcTable())
@@ -179,6 +180,31 @@ func TestWatchTickClearsSnapshotAfterwards(t *testing.T) {
 	}
 }
 
+// TestWithProcSnapshotScopesAndNests pins that a pass installs one snapshot
+// for its whole body, reuses an enclosing pass's snapshot instead of replacing
+// it, and clears only what it installed.
+func TestWithProcSnapshotScopesAndNests(t *testing.T) {
+	m := newTestManager(t)
+	var outer, inner *procTable
+	m.withProcSnapshot(func() {
+		outer = m.snapshotProcs()
+		m.withProcSnapshot(func() { inner = m.snapshotProcs() })
+		if m.snapshotProcs() != outer {
+			t.Fatal("a nested pass must not clear the enclosing snapshot")
+		}
+	})
+	if outer == nil || inner != outer {
+		t.Fatalf("nested pass must reuse the enclosing snapshot (outer %p, inner %p)", outer, inner)
+	}
+	if m.snapshotProcs() != nil {
+		t.Fatal("snapshot must be cleared when the outermost pass returns")
+	}
+	m.ListProcesses()
+	if m.snapshotProcs() != nil {
+		t.Fatal("ListProcesses must not leave its snapshot installed")
+	}
+}
+
 // reapedPID returns a pid that has exited and been waited on, so it is neither
 // alive nor a zombie.
 func reapedPID(t *testing.T) int {
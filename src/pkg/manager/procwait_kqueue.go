@@ -0,0 +1,95 @@
+//go:build darwin || freebsd
+
+package manager
+
+import (
+	"errors"
+	"syscall"
+	"time"
+)
+
+// waitForExitEvent blocks until pid exits or the timeout elapses, using a kqueue
+// EVFILT_PROC/NOTE_EXIT registration: the kernel wakes the wait the moment the
+// process dies, instead of a loop re-checking liveness on a timer. The first
+// result reports whether the process is gone; the second is false when the
+// kqueue could not be used (for example EPERM on a foreign process) and the
+// caller should poll instead. A pid that is already gone, or a zombie, fails
+// registration with ESRCH and is reported dead immediately.
+func waitForExitEvent(pid int, timeout time.Duration) (bool, bool) {
+	exited, ok := waitForExitEvents([]int{pid}, timeout)
+	return exited[pid], ok
+}
+
+// waitForExitEvents is waitForExitEvent for a set of pids sharing one deadline,
+// all registered on a single kqueue so the wait ends as soon as the last of
+// them exits. It returns the pids seen to exit; any other pid was still
+// running at the deadline.
+func waitForExitEvents(pids []int, timeout time.Duration) (map[int]bool, bool) {
+	kq, err := syscall.Kqueue()
+	if err != nil {
+		return nil, false
+	}
+	defer func() { _ = syscall.Close(kq) }()
+	changes := make([]syscall.Kevent_t, len(pids))
+	for i, pid := range pids {
+		syscall.SetKevent(&changes[i], pid, syscall.EVFILT_PROC, syscall.EV_ADD|syscall.EV_ONESHOT|syscall.EV_RECEIPT)
+		changes[i].Fflags = syscall.NOTE_EXIT
+	}
+	events := make([]syscall.Kevent_t, len(pids))
+	// EV_RECEIPT makes every registration report back as an EV_ERROR event
+	// carrying 0 or the errno, without dequeuing any exit already pending.
+	n, err := keventIgnoringEINTR(kq, changes, events, &syscall.Timespec{})
+	if err != nil {
+		return nil, false
+	}
+	exited := make(map[int]bool, len(pids))
+	pending := make(map[int]bool, len(pids))
+	for _, pid := range pids {
+		pending[pid] = true
+	}
+	for _, ev := range events[:n] {
+		switch syscall.Errno(ev.Data) {
+		case 0:
+		case syscall.ESRCH:
+			exited[int(ev.Ident)] = true
+			delete(pending, int(ev.Ident))
+		default:
+			return nil, false
+		}
+	}
+	deadline := time.Now().Add(timeout)
+	for len(pending) > 0 {
+		remaining := time.Until(deadline)
+		if remaining <= 0 {
+			break
+		}
+		ts := syscall.NsecToTimespec(int64(remaining))
+		n, err := syscall.Kevent(kq, nil, events, &ts)
+		if errors.Is(err, syscall.EINTR) {
+			continue
+		}
+		if err != nil {
+			return nil, false
+		}
+		if n == 0 {
+			break
+		}
+		for _, ev := range events[:n] {
+			exited[int(ev.Ident)] = true
+			delete(pending, int(ev.Ident))
+		}
+	}
+	return exited, true
+}
+
+// keventIgnoringEINTR is syscall.Kevent retried when a signal interrupts it.
+// Re-submitting registrations is harmless: EV_ADD on an existing one only
+// updates it.
+func keventIgnoringEINTR(kq int, changes, events []syscall.Kevent_t, timeout *syscall.Timespec) (int, error) {
+	for {
+		n, err := syscall.Kevent(kq, changes, events, timeout)
+		if !errors.Is(err, syscall.EINTR) {
+			return n, err
+		}
+	}
+}
@@ -0,0 +1,15 @@
+//go:build !(darwin || freebsd)
+
+package manager
+
+import "time"
+
+// waitForExitEvent has no event source off the kqueue platforms; callers poll.
+func waitForExitEvent(pid int, timeout time.Duration) (bool, bool) {
+	return false, false
+}
+
+// waitForExitEvents has no event source off the kqueue platforms; callers poll.
+func waitForExitEvents(pids []int, timeout time.Duration) (map[int]bool, bool) {
+	return nil, false
+}
@@ -5,12 +5,16 @@ import "time"
 // processStatus returns the live pid of a managed process, or (0, false) if it
 // is not running. PID-reuse is defeated by matching the recorded start time.
 func (m *Manager) processStatus(name string) (int, bool) {
-	data := m.loadStateFile()
-	p, ok := data.Processes[name]
-	if !ok || p.Pid == nil {
+	return m.liveStatus(m.loadStateFile().Processes[name])
+}
+
+// liveStatus is processStatus for an entry already read from state; a nil
+// entry is not running.
+func (m *Manager) liveStatus(p *Process) (int, bool) {
+	if p == nil || p.Pid == nil {
 		return 0, false
 	}
-	if isOurProcessVia(m.snapshotProcs(), *p.Pid, p.StartTime) {
+	if m.isOurPid(*p.Pid, p.StartTime) {
 		return *p.Pid, true
 	}
 	return 0, false
@@ -21,18 +25,40 @@ func (m *Manager) Status(name string) (int, bool) {
 	return m.processStatus(name)
 }
 
-// isExplicitlyStopped reports whether the user stopped the process via `stop`.
-func (m *Manager) isExplicitlyStopped(name string) bool {
-	data := m.loadStateFile()
-	p, ok := data.Processes[name]
-	if !ok {
-		return false
-	}
-	return p.ExplicitlyStopped
-}
-
 // nowUnix returns the current time as a unix timestamp in seconds, matching the
 // float timestamps stored by the original implementation.
 func nowUnix() float64 {
 	return float64(time.Now().UnixNano()) / 1e9
 }
+
+// Adaptive polling bounds for pollUntil. The first re-check comes almost
+// immediately, catching the common fast case (a process that exits on its
+// first SIGTERM, a port released as its holder dies) in milliseconds; the
+// interval then grows to the old fixed 100ms so a slow wait costs no more
+// wake-ups than the fixed loop did. The 1ms start is affordable because the
+// checks polled are single syscalls on darwin (a sysctl or a bind), and
+// process-death waits reach this loop only when neither the reaper nor kqueue
+// can report the exit.
+const (
+	pollIntervalMin    = 1 * time.Millisecond
+	pollIntervalMax    = 100 * time.Millisecond
+	pollIntervalGrowth = 2
+)
+
+// pollUntil re-evaluates done with a growing interval until it reports true or
+// the timeout elapses, returning done's final verdict.
+func pollUntil(timeout time.Duration, done func() bool) bool {
+	deadline := time.Now().Add(timeout)
+	interval := pollIntervalMin
+	for time.Now().Before(deadline) {
+		if done() {
+			return true
+		}
+		time.Sleep(interval)
+		interval = time.Duration(float64(interval) * pollIntervalGrowth)
+		if interval > pollIntervalMax {
+			interval = pollIntervalMax
+		}
+	}
+	return done()
+}
@@ -1,6 +1,9 @@
 package manager
 
-import "testing"
+import (
+	"testing"
+	"time"
+)
 
 func TestProcessStatusDeadWhenNeverStarted(t *testing.T) {
 	m := newTestManager(t)
@@ -10,18 +13,18 @@ func TestProcessStatusDeadWhenNeverStarted(t *testing.T) {
 	}
 }
 
-func TestIsExplicitlyStopped(t *testing.T) {
+func TestMarkAndClearExplicitStop(t *testing.T) {
 	m := newTestManager(t)
 	mustAdd(t, m, "svc", "sleep 1", nil)
-	if m.isExplicitlyStopped("svc") {
+	if m.loadStateFile().Processes["svc"].ExplicitlyStopped {
 		t.Fatal("new process should not be explicitly stopped")
 	}
 	m.markExplicitlyStopped("svc")
-	if !m.isExplicitlyStopped("svc") {
+	if !m.loadStateFile().Processes["svc"].ExplicitlyStopped {
 		t.Fatal("should be explicitly stopped after marking")
 	}
 	m.clearExplicitStop("svc")
-	if m.isExplicitlyStopped("svc") {
+	if m.loadStateFile().Processes["svc"].ExplicitlyStopped {
 		t.Fatal("should be cleared")
 	}
 }
@@ -31,3 +34,19 @@ func TestNowUnixPositive(t *testing.T) {
 		t.Fatal("nowUnix should be positive")
 	}
 }
+
+func TestPollUntilReturnsAsSoonAsDone(t *testing.T) {
+	calls := 0
+	start := time.Now()
+	if !pollUntil(5*time.Second, func() bool { calls++; return calls >= 3 }) {
+		t.Fatal("pollUntil should report done")
+	}
+	// Two sleeps at the start of the adaptive schedule, far below the old
+	// fixed 100ms-per-check loop.
+	if elapsed := time.Since(start); elapsed >= 200*time.Millisecond {
+		t.Fatalf("pollUntil took %v for three checks", elapsed)
+	}
+	if pollUntil(50*time.Millisecond, func() bool { return false }) {
+		t.Fatal("pollUntil must report false when the condition never holds")
+	}
+}
@@ -7,6 +7,7 @@ import (
 	"path/filepath"
 	"regexp"
 	"strconv"
+	"sync"
 	"syscall"
 	"time"
 )
@@ -14,8 +15,12 @@ import (
 // LaunchAgentLabel is the launchd label for the auto watch daemon.
 const LaunchAgentLabel = "com.darrenoakey.auto"
 
-// pidLinePattern extracts the pid from `launchctl list <label>` output.
-var pidLinePattern = regexp.MustCompile(`"PID"\s*=\s*(\d+)`)
+// pidLinePattern extracts the pid from `launchctl list <label>` output. It is
+// compiled on first use rather than at package init, so the CLI commands that
+// never ask for the daemon's pid (most of them) do not pay for it at startup.
+var pidLinePattern = sync.OnceValue(func() *regexp.Regexp {
+	return regexp.MustCompile(`"PID"\s*=\s*(\d+)`)
+})
 
 // killTarget is a running managed process targeted for shutdown.
 type killTarget struct {
@@ -25,18 +30,24 @@ type killTarget struct {
 }
 
 // ShutdownAll stops all running managed processes in parallel without marking
-// them explicitly stopped, so they recover after the next boot.
-func (m *Manager) ShutdownAll() {
+// them explicitly stopped, so they recover after the next boot. It returns the
+// names of the processes it signalled, so callers can report on them without
+// a second status pass of their own.
+func (m *Manager) ShutdownAll() []string {
 	targets := m.runningTargets()
 	if len(targets) == 0 {
-		return
+		return nil
+	}
+	names := make([]string, 0, len(targets))
+	for _, t := range targets {
+		names = append(names, t.name)
 	}
 	for _, t := range targets {
 		_ = syscall.Kill(-t.pgid, syscall.SIGTERM)
 	}
 	alive := waitForTargets(targets, SigtermTimeout)
 	if len(alive) == 0 {
-		return
+		return names
 	}
 	for _, t := range alive {
 		_ = syscall.Kill(-t.pgid, syscall.SIGKILL)
@@ -44,41 +55,83 @@ func (m *Manager) ShutdownAll() {
 	for _, t := range waitForTargets(alive, 2*time.Second) {
 		fmt.Printf("Warning: process %s (pid %d) survived SIGKILL\n", t.name, t.pid)
 	}
+	return names
 }
 
 // runningTargets collects all currently-running managed processes with pgids.
 func (m *Manager) runningTargets() []killTarget {
 	var targets []killTarget
-	for _, name := range sortedNames(m.loadStateFile().Processes) {
-		pid, alive := m.processStatus(name)
-		if !alive {
-			continue
-		}
-		if pgid, err := syscall.Getpgid(pid); err == nil {
-			targets = append(targets, killTarget{name: name, pid: pid, pgid: pgid})
+	m.withProcSnapshot(func() {
+		for _, name := range sortedNames(m.loadStateFile().Processes) {
+			pid, alive := m.processStatus(name)
+			if !alive {
+				continue
+			}
+			if pgid, err := syscall.Getpgid(pid); err == nil {
+				targets = append(targets, killTarget{name: name, pid: pid, pgid: pgid})
+			}
 		}
-	}
+	})
 	return targets
 }
 
-// waitForTargets polls until all targets die or the timeout elapses, returning
-// any survivors.
+// waitForTargets waits until all targets die or the timeout elapses, returning
+// any survivors. Where the kernel reports process exits (waitForExitEvents)
+// every target is watched at once and the wait ends the moment the last one
+// exits; the survivors it reports are confirmed with one snapshot. Otherwise
+// the targets are polled.
 func waitForTargets(targets []killTarget, timeout time.Duration) []killTarget {
-	deadline := time.Now().Add(timeout)
-	alive := targets
-	for len(alive) > 0 && time.Now().Before(deadline) {
-		time.Sleep(100 * time.Millisecond)
-		remaining := alive[:0:0]
-		for _, t := range alive {
-			if isProcessAlive(t.pid) {
+	pids := make([]int, len(targets))
+	for i, t := range targets {
+		pids[i] = t.pid
+	}
+	if exited, ok := waitForExitEvents(pids, timeout); ok {
+		remaining := targets[:0:0]
+		for _, t := range targets {
+			if !exited[t.pid] {
 				remaining = append(remaining, t)
 			}
 		}
-		alive = remaining
+		if len(remaining) == 0 {
+			return nil
+		}
+		return survivingTargets(remaining)
 	}
+	alive := targets
+	pollUntil(timeout, func() bool {
+		alive = survivingTargets(alive)
+		return len(alive) == 0
+	})
 	return alive
 }
 
+// survivingTargets filters targets down to those still running, answering the
+// whole set from one process-table snapshot per poll round instead of one `ps`
+// per target. Unlike the watch tick, a negative from this snapshot is
+// trustworthy: every target was already running before the snapshot was
+// taken, so a target missing from it is gone. Without a snapshot each target
+// is checked on its own.
+func survivingTargets(targets []killTarget) []killTarget {
+	table := newProcTable()
+	remaining := targets[:0:0]
+	for _, t := range targets {
+		if targetAlive(table, t.pid) {
+			remaining = append(remaining, t)
+		}
+	}
+	return remaining
+}
+
+// targetAlive reports whether pid is running and not a zombie, per the
+// snapshot when there is one.
+func targetAlive(table *procTable, pid int) bool {
+	if table == nil {
+		return isProcessAlive(pid)
+	}
+	entry, present := table.lookup(pid)
+	return present && entry.state != "" && entry.state != "Z" && entry.state != "Z+"
+}
+
 // AutoDaemonPid returns the pid of the running auto watch daemon via launchctl,
 // or 0 if it is not running.
 func AutoDaemonPid() int {
@@ -86,7 +139,7 @@ func AutoDaemonPid() int {
 	if err != nil {
 		return 0
 	}
-	match := pidLinePattern.FindSubmatch(out)
+	match := pidLinePattern().FindSubmatch(out)
 	if match == nil {
 		return 0
 	}
@@ -116,7 +169,7 @@ func (m *Manager) ShutdownForReboot() {
 		_ = exec.Command("launchctl", "bootout", fmt.Sprintf("gui/%d", os.Getuid()), plist).Run()
 	}
 	if daemonPid != 0 {
-		waitForProcessDeath(daemonPid, SigtermTimeout)
+		m.waitForProcessDeath(daemonPid, SigtermTimeout)
 	}
 	m.ShutdownAll()
 }
@@ -1,11 +1,13 @@
 package manager
 
 import (
+	"os"
 	"path/filepath"
 	"testing"
 )
 
 func TestShutdownAllKillsRunning(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "a", "sleep 300", nil)
 	mustAdd(t, m, "b", "sleep 300", nil)
@@ -17,13 +19,26 @@ func TestShutdownAllKillsRunning(t *testing.T) {
 	if err != nil {
 		t.Fatalf("start b: %v", err)
 	}
-	m.ShutdownAll()
+	stopped := m.ShutdownAll()
 	if isProcessAlive(pidA) || isProcessAlive(pidB) {
 		t.Fatalf("ShutdownAll left survivors: a=%v b=%v", isProcessAlive(pidA), isProcessAlive(pidB))
 	}
+	if len(stopped) != 2 || stopped[0] != "a" || stopped[1] != "b" {
+		t.Fatalf("ShutdownAll reported %v, want [a b]", stopped)
+	}
+}
+
+func TestSurvivingTargetsDropsDeadPids(t *testing.T) {
+	self := killTarget{name: "self", pid: os.Getpid()}
+	dead := killTarget{name: "dead", pid: reapedPID(t)}
+	got := survivingTargets([]killTarget{self, dead})
+	if len(got) != 1 || got[0].name != "self" {
+		t.Fatalf("survivingTargets = %+v, want only self", got)
+	}
 }
 
 func TestRunningTargetsOnlyIncludesAlive(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "live", "sleep 300", nil)
 	mustAdd(t, m, "dead", "sleep 300", nil)
@@ -39,7 +54,7 @@ func TestRunningTargetsOnlyIncludesAlive(t *testing.T) {
 
 func TestPidLinePatternExtractsPid(t *testing.T) {
 	sample := "{\n\t\"Label\" = \"com.darrenoakey.auto\";\n\t\"PID\" = 1061;\n}"
-	match := pidLinePattern.FindSubmatch([]byte(sample))
+	match := pidLinePattern().FindSubmatch([]byte(sample))
 	if match == nil || string(match[1]) != "1061" {
 		t.Fatalf("failed to extract pid from sample, match=%v", match)
 	}
@@ -6,6 +6,7 @@ import (
 	"os"
 	"os/exec"
 	"strings"
+	"sync/atomic"
 	"syscall"
 	"time"
 )
@@ -15,7 +16,7 @@ import (
 // rather than counted against the restart backoff.
 var transientSpawnErrnos = []error{syscall.EDEADLK, syscall.EAGAIN, syscall.ENOMEM}
 
-// spawnWithRetry launches `exec <command>` via /bin/sh in a new session and
+// spawnWithRetry launches command in a new session (see spawnCommand) and
 // returns the running process and its log path. It retries spawn failure
 // shapes that are not the service's fault: the parent fork/exec raising a
 // transient errno, the child shell's execve failing asynchronously (detected
@@ -25,10 +26,9 @@ var transientSpawnErrnos = []error{syscall.EDEADLK, syscall.EAGAIN, syscall.ENOM
 // before retrying so the restart converges within this single call instead of
 // bouncing through the caller's crash-restart backoff.
 func (m *Manager) spawnWithRetry(name, command, workdir string, port *int) (int, string, error) {
-	wrapped := "exec " + command
 	var lastErr error
 	for attempt := 0; attempt < SpawnRetryAttempts; attempt++ {
-		pid, logPath, offset, err := m.spawnOnce(name, wrapped, workdir)
+		pid, logPath, offset, err := m.spawnCommand(name, command, workdir)
 		if err != nil {
 			if !isTransientSpawnError(err) {
 				return 0, "", err
@@ -38,7 +38,7 @@ func (m *Manager) spawnWithRetry(name, command, workdir string, port *int) (int,
 			continue
 		}
 		if childStillRunning(pid) {
-			reapWhenDone(pid)
+			m.reapWhenDone(pid)
 			return pid, logPath, nil
 		}
 		if logHasAddressInUse(logPath, offset) {
@@ -61,19 +61,64 @@ func (m *Manager) spawnWithRetry(name, command, workdir string, port *int) (int,
 	return 0, "", fmt.Errorf("cannot start %s: no spawn attempts were made", name)
 }
 
+// shellMetachars are the characters that make /bin/sh do more with a command
+// than split it on blanks: quoting, expansion, globbing, redirection,
+// pipelines, lists, subshells and comments.
+const shellMetachars = "\"'\\$`*?[]{}~;&|<>()#!\n"
+
+// directArgv returns command as an argv when it is a plain list of blank-
+// separated words, which /bin/sh would run unchanged, and nil when it needs
+// the shell. A leading NAME=value word is an environment assignment to sh, so
+// it also needs the shell.
+func directArgv(command string) []string {
+	if strings.ContainsAny(command, shellMetachars) {
+		return nil
+	}
+	argv := strings.FieldsFunc(command, func(r rune) bool { return r == ' ' || r == '\t' })
+	if len(argv) == 0 || strings.Contains(argv[0], "=") {
+		return nil
+	}
+	return argv
+}
+
+// spawnCommand starts one attempt at command. A plain command (directArgv) is
+// exec'd directly, saving the /bin/sh fork+exec and parse that `sh -c "exec
+// ..."` costs on every start; anything else, and any direct exec that fails
+// for a non-transient reason such as a missing binary, runs as
+// `/bin/sh -c "exec <command>"` so sh reports the failure in the service log
+// exactly as it always has.
+func (m *Manager) spawnCommand(name, command, workdir string) (int, string, int64, error) {
+	if argv := directArgv(command); argv != nil {
+		pid, logPath, offset, err := m.spawnOnce(name, argv, workdir)
+		if err == nil || isTransientSpawnError(err) {
+			return pid, logPath, offset, err
+		}
+	}
+	return m.spawnOnce(name, []string{"/bin/sh", "-c", "exec " + command}, workdir)
+}
+
 // spawnOnce performs a single fork/exec and waits the grace period implicitly via
 // the caller's liveness check. It returns the child pid, its log path, and the
 // byte offset at which this spawn's output begins (the file is appended to, so
 // the caller only inspects content written from offset onward).
-func (m *Manager) spawnOnce(name, wrapped, workdir string) (int, string, int64, error) {
+func (m *Manager) spawnOnce(name string, argv []string, workdir string) (int, string, int64, error) {
 	logPath := m.dailyLogPath(name)
-	offset := fileSize(logPath)
 	logFile, err := os.OpenFile(logPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0o644)
+	if os.IsNotExist(err) {
+		// The remembered log directory was removed since it was created.
+		m.forgetLogDir(name)
+		logPath = m.dailyLogPath(name)
+		logFile, err = os.OpenFile(logPath, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0o644)
+	}
 	if err != nil {
 		return 0, "", 0, err
 	}
 	defer func() { _ = logFile.Close() }()
-	cmd := exec.Command("/bin/sh", "-c", wrapped)
+	var offset int64
+	if st, err := logFile.Stat(); err == nil {
+		offset = st.Size()
+	}
+	cmd := exec.Command(argv[0], argv[1:]...)
 	cmd.Stdout = logFile
 	cmd.Stderr = logFile
 	cmd.SysProcAttr = &syscall.SysProcAttr{Setsid: true}
@@ -88,14 +133,6 @@ func (m *Manager) spawnOnce(name, wrapped, workdir string) (int, string, int64,
 	return pid, logPath, offset, nil
 }
 
-// fileSize returns the current size of the file, or 0 if it does not exist.
-func fileSize(path string) int64 {
-	if info, err := os.Stat(path); err == nil {
-		return info.Size()
-	}
-	return 0
-}
-
 // childStillRunning reports whether the child is alive, reaping it if it has
 // already exited so it does not linger as a zombie.
 func childStillRunning(pid int) bool {
@@ -104,15 +141,100 @@ func childStillRunning(pid int) bool {
 	return err == nil && wpid == 0
 }
 
+// liveChild is one entry of the Manager's reaper registry (children): a child
+// this Manager spawned and is still reaping. A child that has not been reaped
+// cannot have its pid reused, so membership proves the pid is that child and
+// alive: the daemon answers liveness for its own services without asking the
+// kernel or `ps`, and a stop can block on the exit itself. For the instant
+// between exit and reap the child still counts as alive, which is no different
+// from a zombie noticed one tick late.
+//
+// The entry is removed just after Wait4 returns, and Wait4 is what frees the
+// pid, so for the few instructions between the two a recycled pid would still
+// read as this child. That window is accepted: the kernel hands out pids in
+// increasing order and only wraps after the whole pid space, so a reuse there
+// needs every other pid to be allocated inside that gap.
+//
+// Membership says nothing about WHICH service the child is: a stale state
+// entry (say, from before a reboot) may record the very pid a new child was
+// just given. Identity checks therefore still compare the recorded start time,
+// against the child's own start time once recordStarted has read it. reaped is
+// closed once the child has been reaped; startTime is nil until recordStarted
+// sets it.
+type liveChild struct {
+	reaped    chan struct{}
+	startTime atomic.Pointer[string]
+}
+
+// ChildExits returns a channel that is signalled after any child this Manager
+// spawned exits and is reaped. The watch daemon selects on it alongside its
+// ticker so a crashed service is noticed the moment it dies rather than on the
+// next tick; exits of services started by other processes still surface on
+// the tick. It holds at most one pending notification: exits that land while
+// one is already pending coalesce into it, which is all a waiting supervisor
+// needs.
+func (m *Manager) ChildExits() <-chan struct{} {
+	return m.childExited
+}
+
 // reapWhenDone blocks in a background goroutine until the child exits and reaps
-// it, preventing zombie accumulation in the long-lived watch daemon.
-func reapWhenDone(pid int) {
+// it, so the long-lived daemon never accumulates zombies. Until then the pid is
+// registered in m.children.
+func (m *Manager) reapWhenDone(pid int) {
+	child := &liveChild{reaped: make(chan struct{})}
+	m.children.Store(pid, child)
 	go func() {
 		var ws syscall.WaitStatus
 		_, _ = syscall.Wait4(pid, &ws, 0, nil)
+		m.children.CompareAndDelete(pid, child)
+		close(child.reaped)
+		select {
+		case m.childExited <- struct{}{}:
+		default:
+		}
 	}()
 }
 
+// isLiveChild reports whether pid is a child this Manager spawned that has not
+// yet exited and been reaped.
+func (m *Manager) isLiveChild(pid int) bool {
+	_, ok := m.children.Load(pid)
+	return ok
+}
+
+// childReaped returns the channel closed when the live child pid is reaped, or
+// false if pid is not a live child of this Manager.
+func (m *Manager) childReaped(pid int) (<-chan struct{}, bool) {
+	v, ok := m.children.Load(pid)
+	if !ok {
+		return nil, false
+	}
+	return v.(*liveChild).reaped, true
+}
+
+// setLiveChildStartTime records startTime for the live child pid, so identity
+// checks on it need no further lookup. An empty start time, or a pid that is
+// not a live child, is ignored.
+func (m *Manager) setLiveChildStartTime(pid int, startTime string) {
+	if v, ok := m.children.Load(pid); ok && startTime != "" {
+		v.(*liveChild).startTime.Store(&startTime)
+	}
+}
+
+// liveChildStartTime returns the start time recorded for the live child pid,
+// or false if pid is not a live child or has no start time recorded yet.
+func (m *Manager) liveChildStartTime(pid int) (string, bool) {
+	v, ok := m.children.Load(pid)
+	if !ok {
+		return "", false
+	}
+	st := v.(*liveChild).startTime.Load()
+	if st == nil {
+		return "", false
+	}
+	return *st, true
+}
+
 // sleepSpawnBackoff waits between spawn retries, jittered per-name so concurrent
 // spawns do not retry in lockstep.
 func sleepSpawnBackoff(name string, attempt int) {
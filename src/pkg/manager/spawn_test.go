@@ -5,12 +5,14 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"strings"
 	"syscall"
 	"testing"
 	"time"
 )
 
 func TestSpawnWithRetrySurvivor(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	pid, logPath, err := m.spawnWithRetry("svc", "sleep 300", "", nil)
 	if err != nil {
@@ -26,6 +28,7 @@ func TestSpawnWithRetrySurvivor(t *testing.T) {
 }
 
 func TestSpawnWithRetryFastExitHandedBack(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	pid, _, err := m.spawnWithRetry("svc", "true", "", nil)
 	if err != nil {
@@ -218,3 +221,63 @@ func TestIsTransientSpawnError(t *testing.T) {
 		t.Fatal("ENOENT should not be transient")
 	}
 }
+
+func TestDirectArgvOnlyForPlainCommands(t *testing.T) {
+	if got := directArgv("sleep  300\t--flag=x"); fmt.Sprint(got) != "[sleep 300 --flag=x]" {
+		t.Fatalf("directArgv(plain) = %q", got)
+	}
+	for _, cmd := range []string{"", "echo $HOME", "a && b", "ls *.go", "echo 'x y'", "FOO=1 run", "run > out", "cd /tmp; run"} {
+		if got := directArgv(cmd); got != nil {
+			t.Fatalf("directArgv(%q) = %q, want nil (needs the shell)", cmd, got)
+		}
+	}
+}
+
+// TestSpawnMissingBinaryStillLoggedByShell pins that a plain command whose
+// binary does not exist falls back to the shell, so the failure still lands in
+// the service log rather than surfacing only as a spawn error.
+func TestSpawnMissingBinaryStillLoggedByShell(t *testing.T) {
+	t.Parallel()
+	m := newTestManager(t)
+	_, logPath, err := m.spawnWithRetry("svc", "auto-no-such-binary-xyz", "", nil)
+	if err != nil {
+		t.Fatalf("spawnWithRetry: %v", err)
+	}
+	data, _ := os.ReadFile(logPath)
+	if !strings.Contains(string(data), "auto-no-such-binary-xyz") {
+		t.Fatalf("shell did not report the missing binary in the log: %q", data)
+	}
+}
+
+// TestChildExitsSignalledOnReap pins the watch daemon's wake-up: reaping a
+// spawned child leaves a ChildExits signal pending on its own Manager, checked
+// only once this child's reap has completed, and on no other Manager.
+func TestChildExitsSignalledOnReap(t *testing.T) {
+	m := newTestManager(t)
+	other := newTestManager(t)
+	pid, _, _, err := m.spawnCommand("svc", "sleep 0.2", "")
+	if err != nil {
+		t.Fatalf("spawn: %v", err)
+	}
+	m.reapWhenDone(pid)
+	reaped, ok := m.childReaped(pid)
+	if !ok {
+		t.Fatal("spawned child not tracked by the reaper")
+	}
+	select {
+	case <-reaped:
+	case <-time.After(5 * time.Second):
+		t.Fatal("child was not reaped")
+	}
+	// The reaper signals just after closing reaped, so allow it a moment.
+	select {
+	case <-m.ChildExits():
+	case <-time.After(time.Second):
+		t.Fatal("no ChildExits signal after the child was reaped")
+	}
+	select {
+	case <-other.ChildExits():
+		t.Fatal("another Manager was woken by this Manager's child")
+	default:
+	}
+}
@@ -19,11 +19,11 @@ func TestWatchTickDoesNotRaceAConcurrentStart(t *testing.T) {
 	t.Cleanup(func() { _ = m.StopProcess("racer", true) })
 
 	// Simulate the claiming process being mid-spawn: claimed, no pid yet.
-	if !m.claimStart("racer") {
+	if !m.claimStartCounting("racer", false) {
 		t.Fatal("first claim must succeed")
 	}
 
-	if m.shouldRestart("racer") {
+	if m.shouldRestartEntry("racer", m.loadStateFile().Processes["racer"]) {
 		t.Fatal("watch loop must not restart a process whose start is in flight")
 	}
 	m.WatchTick()
@@ -38,7 +38,7 @@ func TestWatchTickDoesNotRaceAConcurrentStart(t *testing.T) {
 
 	// Once the claim clears, supervision resumes normally.
 	m.clearStartClaim("racer")
-	if !m.shouldRestart("racer") {
+	if !m.shouldRestartEntry("racer", m.loadStateFile().Processes["racer"]) {
 		t.Fatal("supervision must resume once the start claim is released")
 	}
 }
@@ -54,10 +54,10 @@ func TestStartClaimExpiresSoAStuckClaimCannotWedgeSupervision(t *testing.T) {
 	stale := nowUnix() - StartInFlightTTL.Seconds() - 1
 	m.mutateProcess("stuck", func(p *Process) { p.StartingSince = &stale })
 
-	if !m.shouldRestart("stuck") {
+	if !m.shouldRestartEntry("stuck", m.loadStateFile().Processes["stuck"]) {
 		t.Fatal("an expired start claim must not keep suppressing supervision")
 	}
-	if !m.claimStart("stuck") {
+	if !m.claimStartCounting("stuck", false) {
 		t.Fatal("an expired claim must be reclaimable")
 	}
 }
@@ -65,6 +65,7 @@ func TestStartClaimExpiresSoAStuckClaimCannotWedgeSupervision(t *testing.T) {
 // TestRecordStartedClearsTheStartClaim pins that a successful start releases
 // its claim, so the very next tick supervises the process normally.
 func TestRecordStartedClearsTheStartClaim(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "clears", "sleep 300", nil)
 	if _, err := m.StartProcess("clears"); err != nil {
@@ -100,7 +101,7 @@ func TestFailedStartReleasesTheClaim(t *testing.T) {
 		t.Fatal("a failed start must release its claim so the watch loop can retry")
 	}
 	// The watch loop must be free to try again immediately.
-	if !m.shouldRestart("doomed") {
+	if !m.shouldRestartEntry("doomed", m.loadStateFile().Processes["doomed"]) {
 		t.Fatal("supervision must resume after a failed start releases its claim")
 	}
 }
@@ -109,6 +110,7 @@ func TestFailedStartReleasesTheClaim(t *testing.T) {
 // and watch ticks run concurrently, exactly as the CLI and the daemon do. Only
 // one copy may ever exist.
 func TestConcurrentStartAndWatchTickSpawnExactlyOnce(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "concurrent", "sleep 31427", nil)
 	t.Cleanup(func() { _ = m.StopProcess("concurrent", true) })
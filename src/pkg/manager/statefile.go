@@ -1,7 +1,9 @@
 package manager
 
 import (
+	"bytes"
 	"encoding/json"
+	"errors"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -12,14 +14,16 @@ import (
 // Process is one entry in the state file: both its definition (command, port,
 // workdir) and its runtime state (pid, restart bookkeeping). Field names and
 // nullability match the original Python state.json exactly so existing files
-// load unchanged.
+// load unchanged. Every field is omitted at its zero value (nil, 0, false, ""),
+// which is also what a missing key decodes to, so the file carries only what is
+// actually set and stays small to rewrite on every mutation.
 type Process struct {
 	Command                string   `json:"command,omitempty"`
 	Port                   *int     `json:"port,omitempty"`
 	Workdir                string   `json:"workdir,omitempty"`
 	Pid                    *int     `json:"pid,omitempty"`
 	StartTime              *string  `json:"start_time,omitempty"`
-	ExplicitlyStopped      bool     `json:"explicitly_stopped"`
+	ExplicitlyStopped      bool     `json:"explicitly_stopped,omitempty"`
 	RestartAttempt         int      `json:"restart_attempt,omitempty"`
 	LastRestartTime        *float64 `json:"last_restart_time,omitempty"`
 	LogPath                string   `json:"log_path,omitempty"`
@@ -36,7 +40,12 @@ type Process struct {
 	StartingSince *float64 `json:"starting_since,omitempty"`
 }
 
-// stateFile is the top-level shape of state.json.
+// stateFile is the top-level shape of state.json. The single-object layout is
+// a compatibility contract, not an accident: old state files must load
+// unchanged, and a rolled-back binary must still read what a newer one wrote.
+// A per-record format (JSON lines) would save little anyway, since every write
+// already rewrites the whole file under the lock and the file holds only tens
+// of small entries.
 type stateFile struct {
 	Processes map[string]*Process `json:"processes"`
 }
@@ -45,26 +54,31 @@ type stateFile struct {
 // corruption via the .bak backup when possible. An empty or corrupt file with
 // no valid backup is treated as fresh state rather than crashing the supervisor.
 //
-// It is the cache-miss path and the reader used by mutators (withState), which
-// must always see the latest committed state. Read-only callers use
-// loadStateFile, which returns a memoized snapshot of this result.
-func (m *Manager) loadStateFresh() *stateFile {
-	data, err := readStateJSON(m.statePath())
+// It is the cache-miss path, and what mutators (withState) read whenever the
+// cache cannot vouch for the file on disk (see stateForMutation): they must
+// always see the latest committed state. Read-only callers use loadStateFile,
+// which returns a memoized snapshot of this result.
+//
+// Alongside the state it returns the FileInfo of the state file it parsed, or
+// nil when the state did not come from that file (missing, recovered from the
+// backup, or reset).
+func (m *Manager) loadStateFresh() (*stateFile, os.FileInfo) {
+	data, info, err := readStateJSON(m.statePath())
 	if err == nil {
-		return data
+		return data, info
 	}
 	if os.IsNotExist(err) {
 		// A missing state file is normal on first run, not corruption.
-		return &stateFile{Processes: map[string]*Process{}}
+		return &stateFile{Processes: map[string]*Process{}}, nil
 	}
 	backup := backupPath(m.statePath())
-	if recovered, berr := readStateJSON(backup); berr == nil {
+	if recovered, _, berr := readStateJSON(backup); berr == nil {
 		fmt.Printf("Warning: %s corrupt (%v), restored from backup\n", m.statePath(), err)
 		m.saveStateFile(recovered)
-		return recovered
+		return recovered, nil
 	}
 	fmt.Printf("Warning: %s corrupt (%v), no valid backup, treating as fresh state\n", m.statePath(), err)
-	return &stateFile{Processes: map[string]*Process{}}
+	return &stateFile{Processes: map[string]*Process{}}, nil
 }
 
 // loadStateFile returns the current state for read-only callers, memoizing the
@@ -74,7 +88,7 @@ func (m *Manager) loadStateFresh() *stateFile {
 // the daemon's entire CPU footprint.
 //
 // The returned *stateFile is shared read-only memory: callers must not mutate
-// it. Every mutation goes through withState -> loadStateFresh -> saveStateFile,
+// it. Every mutation goes through withState -> stateForMutation -> saveStateFile,
 // and saveStateFile bumps stateCacheGen to invalidate this snapshot. A write by
 // a concurrent CLI invocation (a separate process with its own Manager) is
 // detected by a stat mtime/size change. The snapshot self-heals within one tick.
@@ -87,25 +101,79 @@ func (m *Manager) loadStateFile() *stateFile {
 		m.stateCacheMu.Unlock()
 		return cached
 	}
+	gen := m.stateCacheGen
 	m.stateCacheMu.Unlock()
 
-	data := m.loadStateFresh()
+	data, info := m.loadStateFresh()
 	if data == nil {
 		data = &stateFile{Processes: map[string]*Process{}}
 	}
 
-	// Re-stat after loadStateFresh: a corruption-recovery write (or a racing
-	// external write) may have changed the file, and the cache must key on the
-	// post-read mtime so it invalidates correctly on the next change.
-	st2, _ := os.Stat(path)
+	// The cache is keyed on the stat of the very file that was parsed, taken
+	// from its open descriptor, so no second path lookup is needed and a write
+	// that replaces the file just after the read cannot lend the old content
+	// its new mtime. Only when the state did not come from that file (a
+	// corruption recovery rewrote it, or it is missing) is it stat'ed again.
+	//
+	// The result is cached only if no save by this Manager landed while it was
+	// being read. Otherwise this read may predate that write yet be stored
+	// under its generation, and the cache would serve the old state until the
+	// file changed again; such a result is still returned, just not kept.
+	st2 := info
+	if st2 == nil {
+		st2, _ = os.Stat(path)
+	}
 	m.stateCacheMu.Lock()
-	m.stateCache = data
-	m.stateCacheMtime, m.stateCacheSize, m.stateCacheExists = cacheStatOf(st2, st)
-	m.stateCacheSavedGen = m.stateCacheGen
+	if m.stateCacheGen == gen {
+		m.stateCache = data
+		m.stateCacheMtime, m.stateCacheSize, m.stateCacheExists = cacheStatOf(st2, st)
+		m.stateCacheSavedGen = gen
+		m.stateCacheOwnWrite = nil
+	}
 	m.stateCacheMu.Unlock()
 	return data
 }
 
+// stateForMutation returns a private, mutable copy of the latest committed
+// state for withState, which must already hold the state lock.
+//
+// When the cache holds this Manager's own last write and the file on disk is
+// still that very file, the copy is cloned from the cache instead of re-read
+// and re-parsed: back-to-back transactions such as a stop (mark stopped, then
+// clear the pid) or a restart (count the attempt, claim, record the pid) used
+// to read the whole file back once per step. Every other case goes to disk.
+// Only saveStateFile's own write is trusted, never a snapshot filled by a
+// read, because a read can race a writer that rewrites the file in place.
+// A mutator that reused stale state would silently overwrite a concurrent
+// invocation's write, which is the state-wipe failure this lock exists to
+// prevent.
+func (m *Manager) stateForMutation() *stateFile {
+	st, err := os.Stat(m.statePath())
+	m.stateCacheMu.Lock()
+	own, written := m.stateCache, m.stateCacheOwnWrite
+	current := own != nil && written != nil && err == nil && m.stateCacheSavedGen == m.stateCacheGen &&
+		os.SameFile(st, written) && st.Size() == written.Size() && st.ModTime().Equal(written.ModTime())
+	m.stateCacheMu.Unlock()
+	if current {
+		return own.clone()
+	}
+	data, _ := m.loadStateFresh()
+	return data
+}
+
+// clone returns a copy of the state whose entries can be edited without
+// touching the receiver. Copying each Process struct is enough: mutators only
+// ever point a field at a new value and never write through an existing
+// pointer, so the pointed-to values are safely shared.
+func (s *stateFile) clone() *stateFile {
+	out := &stateFile{Processes: make(map[string]*Process, len(s.Processes))}
+	for name, p := range s.Processes {
+		entry := *p
+		out.Processes[name] = &entry
+	}
+	return out
+}
+
 // stateFileUnchanged reports whether the on-disk state file still matches the
 // cached snapshot described by (exists, mtime, size). A missing file matches
 // only another missing file; any other stat error forces a re-read.
@@ -132,56 +200,162 @@ func cacheStatOf(st2, st os.FileInfo) (time.Time, int64, bool) {
 }
 
 // readStateJSON parses a state file from disk, returning an error for missing,
-// empty, or malformed content so the caller can fall back to the backup.
-func readStateJSON(path string) (*stateFile, error) {
-	raw, err := os.ReadFile(path)
+// empty, or malformed content so the caller can fall back to the backup. It
+// also returns the file's FileInfo, from the same descriptor the content was
+// read through.
+func readStateJSON(path string) (*stateFile, os.FileInfo, error) {
+	f, err := os.Open(path)
 	if err != nil {
-		return nil, err
+		return nil, nil, err
 	}
-	if strings.TrimSpace(string(raw)) == "" {
-		return nil, fmt.Errorf("empty file")
+	defer func() { _ = f.Close() }()
+	info, err := f.Stat()
+	if err != nil {
+		return nil, nil, err
+	}
+	var buf bytes.Buffer
+	buf.Grow(int(info.Size()) + bytes.MinRead)
+	if _, err := buf.ReadFrom(f); err != nil {
+		return nil, nil, err
+	}
+	raw := buf.Bytes()
+	if len(bytes.TrimSpace(raw)) == 0 {
+		return nil, nil, fmt.Errorf("empty file")
 	}
 	var data stateFile
 	if err := json.Unmarshal(raw, &data); err != nil {
-		return nil, err
+		var typeErr *json.UnmarshalTypeError
+		if !errors.As(err, &typeErr) {
+			return nil, nil, err
+		}
+		legacy, lerr := decodeLegacyState(raw)
+		if lerr != nil {
+			return nil, nil, err
+		}
+		data = *legacy
 	}
 	if data.Processes == nil {
 		data.Processes = map[string]*Process{}
 	}
-	return &data, nil
+	return &data, info, nil
+}
+
+// decodeLegacyState decodes a state file that still holds Python-era entries
+// in the bare "name": pid form, normalizing each to an entry with only Pid set.
+// The typed decode in readStateJSON rejects such a file with a type error, and
+// only then is it re-decoded here, so current files never pay for the
+// per-entry inspection; the next save writes every entry back as an object,
+// which makes the migration one-shot. Without this a single legacy entry made
+// the whole file look corrupt.
+func decodeLegacyState(raw []byte) (*stateFile, error) {
+	var loose struct {
+		Processes map[string]json.RawMessage `json:"processes"`
+	}
+	if err := json.Unmarshal(raw, &loose); err != nil {
+		return nil, err
+	}
+	data := &stateFile{Processes: make(map[string]*Process, len(loose.Processes))}
+	for name, entry := range loose.Processes {
+		// null would decode into an int as 0; keep it as the typed decode does.
+		var pid int
+		if entry[0] != 'n' && json.Unmarshal(entry, &pid) == nil {
+			data.Processes[name] = &Process{Pid: &pid}
+			continue
+		}
+		var p *Process
+		if err := json.Unmarshal(entry, &p); err != nil {
+			return nil, err
+		}
+		data.Processes[name] = p
+	}
+	return data, nil
 }
 
 // saveStateFile writes the state file atomically (unique temp + rename) and
-// refreshes the .bak backup. A per-write unique temp avoids a rename race
-// between concurrent auto invocations.
-func (m *Manager) saveStateFile(data *stateFile) {
+// refreshes the .bak backup the same way. A per-write unique temp avoids a
+// rename race between concurrent auto invocations, and the backup must never
+// be torn either: it is the only thing loadStateFresh can recover from.
+//
+// The payload is rendered in full before either file is opened and lands in
+// one write call each. It stays indented: the file is the first thing to read
+// when debugging a service, and at tens of entries compact output would save
+// well under a millisecond per save.
+//
+// It returns the stat of the file it renamed into place, or nil if the write
+// failed. The stat is taken on the temp file before the rename (a rename keeps
+// mtime and size), so it describes exactly this write even if another process
+// replaces state.json a moment later.
+func (m *Manager) saveStateFile(data *stateFile) os.FileInfo {
 	path := m.statePath()
 	_ = os.MkdirAll(filepath.Dir(path), 0o755)
 	payload, err := json.MarshalIndent(data, "", "  ")
 	if err != nil {
-		return
+		return nil
 	}
-	tmp, err := os.CreateTemp(filepath.Dir(path), ".state-*.tmp")
+	written, err := WriteFileAtomic(path, payload, 0o600)
 	if err != nil {
-		return
+		return nil
+	}
+	_, _ = WriteFileAtomic(backupPath(path), payload, 0o600)
+	m.stateCacheMu.Lock()
+	m.stateCacheGen++
+	m.stateCacheMu.Unlock()
+	return written
+}
+
+// WriteFileAtomic replaces path with data via a unique temp file in the same
+// directory and a rename, so readers see either the old or the new content and
+// never a truncated file. It is the one such writer for the state file, its
+// backup and the files `auto install` puts in place. The mode is set on the
+// temp file's descriptor, so CreateTemp's 0600 and the umask never reach the
+// result. It returns the stat of the temp file taken before the rename, which
+// is the stat of path once the rename lands.
+//
+// Nothing is fsynced. State is rewritten on every mutation, and on APFS a
+// plain fsync does not reach stable storage without F_FULLFSYNC anyway; what
+// readers rely on is that the rename is atomic, and the atomic .bak is the
+// recovery path.
+func WriteFileAtomic(path string, data []byte, mode os.FileMode) (os.FileInfo, error) {
+	tmp, err := os.CreateTemp(filepath.Dir(path), "."+filepath.Base(path)+"-*.tmp")
+	if err != nil {
+		return nil, err
 	}
 	tmpName := tmp.Name()
-	if _, err := tmp.Write(payload); err != nil {
-		_ = tmp.Close()
-		_ = os.Remove(tmpName)
-		return
+	_, err = tmp.Write(data)
+	if err == nil {
+		err = tmp.Chmod(mode)
 	}
-	if err := tmp.Close(); err != nil {
-		_ = os.Remove(tmpName)
-		return
+	var written os.FileInfo
+	if err == nil {
+		written, err = tmp.Stat()
 	}
-	if err := os.Rename(tmpName, path); err != nil {
+	if cerr := tmp.Close(); err == nil {
+		err = cerr
+	}
+	if err == nil {
+		err = os.Rename(tmpName, path)
+	}
+	if err != nil {
 		_ = os.Remove(tmpName)
-		return
+		return nil, err
 	}
-	_ = os.WriteFile(backupPath(path), payload, 0o644)
+	return written, nil
+}
+
+// primeStateCache installs data as the read snapshot after this Manager's own
+// committed write, keyed on the stat saveStateFile returned. Without it every
+// mutation was followed by a full re-read and re-parse of the file just
+// written, the first time any read-only caller looked at state again.
+//
+// Only withState primes: its data is never touched after the save, so it is
+// safe to share as read-only memory. The corruption-recovery save in
+// loadStateFresh hands its result on to a mutator and must not prime.
+func (m *Manager) primeStateCache(data *stateFile, written os.FileInfo) {
 	m.stateCacheMu.Lock()
-	m.stateCacheGen++
+	m.stateCache = data
+	m.stateCacheMtime, m.stateCacheSize, m.stateCacheExists = written.ModTime(), written.Size(), true
+	m.stateCacheSavedGen = m.stateCacheGen
+	m.stateCacheOwnWrite = written
 	m.stateCacheMu.Unlock()
 }
 
@@ -102,6 +102,24 @@ func TestSaveStateFileWritesBackup(t *testing.T) {
 	}
 }
 
+// TestWriteFileAtomicSetsMode pins that the requested mode, not CreateTemp's
+// 0600, reaches the file, including when it replaces one with another mode.
+func TestWriteFileAtomicSetsMode(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "f")
+	for _, mode := range []os.FileMode{0o755, 0o600} {
+		if _, err := WriteFileAtomic(path, []byte("x"), mode); err != nil {
+			t.Fatalf("write: %v", err)
+		}
+		info, err := os.Stat(path)
+		if err != nil {
+			t.Fatalf("stat: %v", err)
+		}
+		if info.Mode().Perm() != mode {
+			t.Fatalf("mode = %v, want %v", info.Mode().Perm(), mode)
+		}
+	}
+}
+
 func TestLoadStateFileRecoversFromBackup(t *testing.T) {
 	m := newTestManager(t)
 	mustAdd(t, m, "svc", "sleep 1", nil)
@@ -167,3 +185,91 @@ func TestLoadStateFileCachesReadsAndInvalidatesOnWrite(t *testing.T) {
 		t.Fatalf("external write not picked up: got command %q, want %q", got, "sleep 3")
 	}
 }
+
+// TestWithStatePrimesCacheWithOwnWrite proves a mutation does not force the
+// next read-only load to re-read the file it just wrote: the snapshot is
+// installed from the write itself. The file is replaced with same-size junk
+// under its original mtime and the backup removed, so any re-read would come
+// back empty instead of holding the mutated entry.
+func TestWithStatePrimesCacheWithOwnWrite(t *testing.T) {
+	m := newTestManager(t)
+	mustAdd(t, m, "svc", "sleep 1", nil)
+	m.mutateProcess("svc", func(p *Process) { p.Command = "sleep 2" })
+	st, err := os.Stat(m.statePath())
+	if err != nil {
+		t.Fatalf("stat: %v", err)
+	}
+	junk := make([]byte, st.Size())
+	for i := range junk {
+		junk[i] = ' '
+	}
+	if err := os.WriteFile(m.statePath(), junk, 0o644); err != nil {
+		t.Fatalf("overwrite: %v", err)
+	}
+	if err := os.Chtimes(m.statePath(), st.ModTime(), st.ModTime()); err != nil {
+		t.Fatalf("chtimes: %v", err)
+	}
+	if err := os.Remove(backupPath(m.statePath())); err != nil {
+		t.Fatalf("removing backup: %v", err)
+	}
+	p := m.loadStateFile().Processes["svc"]
+	if p == nil || p.Command != "sleep 2" {
+		t.Fatalf("read after own write was not served from the primed cache: %+v", p)
+	}
+}
+
+func TestSaveStateFileLeavesNoTempFiles(t *testing.T) {
+	m := newTestManager(t)
+	mustAdd(t, m, "svc", "sleep 1", nil)
+	m.mutateProcess("svc", func(p *Process) { p.Command = "sleep 2" })
+	entries, err := os.ReadDir(filepath.Dir(m.statePath()))
+	if err != nil {
+		t.Fatalf("readdir: %v", err)
+	}
+	for _, entry := range entries {
+		if filepath.Ext(entry.Name()) == ".tmp" {
+			t.Fatalf("temp file left behind: %s", entry.Name())
+		}
+	}
+	backup, _, err := readStateJSON(backupPath(m.statePath()))
+	if err != nil {
+		t.Fatalf("backup unreadable: %v", err)
+	}
+	if got := backup.Processes["svc"].Command; got != "sleep 2" {
+		t.Fatalf("backup holds %q, want %q", got, "sleep 2")
+	}
+}
+
+func TestSaveStateFileOmitsDefaultFields(t *testing.T) {
+	m := newTestManager(t)
+	mustAdd(t, m, "svc", "sleep 1", nil)
+	raw, err := os.ReadFile(m.statePath())
+	if err != nil {
+		t.Fatalf("read: %v", err)
+	}
+	var doc map[string]map[string]map[string]any
+	if err := json.Unmarshal(raw, &doc); err != nil {
+		t.Fatalf("parse: %v", err)
+	}
+	entry := doc["processes"]["svc"]
+	for _, key := range []string{"explicitly_stopped", "restart_attempt", "pid", "port", "last_restart_time"} {
+		if _, present := entry[key]; present {
+			t.Fatalf("default-valued %q written to state file: %s", key, raw)
+		}
+	}
+}
+
+// TestLegacyPidOnlyEntryLoads pins that a Python-era "name": pid entry loads as
+// a pid-only entry instead of making the whole file look corrupt, and that
+// the neighbouring entries survive.
+func TestLegacyPidOnlyEntryLoads(t *testing.T) {
+	m := newTestManager(t)
+	seedState(t, m, `{"processes": {"old": 4242, "svc": {"command": "sleep 1"}}}`)
+	data, _ := m.loadStateFresh()
+	if p := data.Processes["old"]; p == nil || p.Pid == nil || *p.Pid != 4242 || p.Command != "" {
+		t.Fatalf("legacy entry = %+v, want pid-only 4242", p)
+	}
+	if p := data.Processes["svc"]; p == nil || p.Command != "sleep 1" {
+		t.Fatalf("neighbouring entry lost: %+v", p)
+	}
+}
@@ -14,34 +14,45 @@ func (m *Manager) WatchTick() {
 	// One process-table snapshot serves every processStatus call in this tick.
 	// Without it each managed service cost two `ps` forks per tick (state +
 	// lstart), so ~40 services meant ~80 fork+execs every second.
-	m.setProcSnapshot(newProcTable())
-	defer m.setProcSnapshot(nil)
+	m.withProcSnapshot(m.superviseAll)
+}
+
+// superviseAll is the body of WatchTick, run under the tick's snapshot. Each
+// service's entry is looked up once, just before it is supervised, and every
+// decision about it is made from that entry; it is not read for the whole
+// tick up front, because a restart takes long enough for a concurrent CLI
+// stop to land before a later service's turn.
+func (m *Manager) superviseAll() {
 	restarts := 0
+	var stable []string
 	for _, name := range m.definedNames() {
-		if _, alive := m.processStatus(name); alive {
-			m.superviseRunning(name)
+		p := m.loadStateFile().Processes[name]
+		if _, alive := m.liveStatus(p); alive {
+			if backoffResetDueOf(p) {
+				stable = append(stable, name)
+			}
+			m.superviseRunning(name, p)
 			continue
 		}
-		if restarts >= MaxRestartsPerWatchTick || !m.shouldRestart(name) {
+		if restarts >= MaxRestartsPerWatchTick || !m.shouldRestartEntry(name, p) {
 			continue
 		}
-		if m.restartDead(name) {
+		if m.restartDead(name, p) {
 			restarts++
 		}
 	}
+	// Backoff resets found during the pass are committed together: one state
+	// rewrite per tick however many services settled at once.
+	m.resetBackoffs(stable)
 }
 
-// superviseRunning maintains a running process: resets backoff once stable and
-// applies a periodic restart if one is due.
-func (m *Manager) superviseRunning(name string) {
-	m.checkAndResetBackoff(name)
-	if !m.needsPeriodicRestart(name) {
+// superviseRunning maintains a running process, applying a periodic restart if
+// one is due. Its backoff reset is batched by WatchTick.
+func (m *Manager) superviseRunning(name string, p *Process) {
+	if !periodicRestartDueOf(p) {
 		return
 	}
-	interval := 0
-	if iv := m.GetRestartInterval(name); iv != nil {
-		interval = *iv
-	}
+	interval := *p.RestartIntervalSeconds
 	pid, err := m.performPeriodicRestart(name)
 	if err != nil {
 		fmt.Printf("Failed periodic restart of %s: %v\n", name, err)
@@ -50,50 +61,59 @@ func (m *Manager) superviseRunning(name string) {
 	fmt.Printf("Periodic restart of %s (every %s) with pid %d\n", name, FormatInterval(interval), pid)
 }
 
-// restartDead attempts to restart one dead process, recording the attempt for
-// backoff. Returns whether a fresh start was performed.
-func (m *Manager) restartDead(name string) bool {
-	m.incrementRestartAttempt(name)
-	pid, err := m.StartProcess(name)
+// restartDead attempts to restart one dead process from its entry p, recording
+// the attempt for backoff. Returns whether a fresh start was performed.
+func (m *Manager) restartDead(name string, p *Process) bool {
+	pid, err := m.startProcess(name, p, true)
 	if err != nil {
 		fmt.Printf("Failed to restart %s: %v\n", name, err)
 		return false
 	}
-	fmt.Printf("Restarted %s with pid %d after %s backoff\n", name, pid, m.restartBackoff(name))
+	fmt.Printf("Restarted %s with pid %d after %s backoff\n", name, pid, restartBackoffOf(p))
 	return true
 }
 
 // StartAll starts every configured process that is not already running, with a
 // small stagger so the boot-time mass start does not fire every fork at once.
 func (m *Manager) StartAll() {
-	started := false
-	for _, name := range m.definedNames() {
-		if _, alive := m.processStatus(name); alive {
-			continue
-		}
-		if started && StartAllSpawnStagger > 0 {
-			time.Sleep(StartAllSpawnStagger)
+	m.withProcSnapshot(func() {
+		started := false
+		for _, name := range m.definedNames() {
+			p := m.loadStateFile().Processes[name]
+			if _, alive := m.liveStatus(p); alive {
+				continue
+			}
+			if started && StartAllSpawnStagger > 0 {
+				time.Sleep(StartAllSpawnStagger)
+				// A CLI start or `auto update` can land during the sleep, and
+				// the start claim only catches starts still in flight: look
+				// the entry up again rather than trusting the one read above.
+				p = nil
+			}
+			started = true
+			if _, err := m.startProcess(name, p, false); err != nil {
+				fmt.Printf("Failed to start %s: %v\n", name, err)
+			}
 		}
-		started = true
-		if _, err := m.StartProcess(name); err != nil {
-			fmt.Printf("Failed to start %s: %v\n", name, err)
-		}
-	}
+	})
 }
 
 // RestartDead restarts all dead, non-explicitly-stopped processes, force-freeing
 // ports. It returns a map of name to the new pid or an error message.
 func (m *Manager) RestartDead() map[string]string {
 	results := make(map[string]string)
-	for _, name := range m.definedNames() {
-		if _, alive := m.processStatus(name); alive || m.isExplicitlyStopped(name) {
-			continue
-		}
-		if pid, err := m.StartProcess(name); err != nil {
-			results[name] = err.Error()
-		} else {
-			results[name] = fmt.Sprintf("pid %d", pid)
+	m.withProcSnapshot(func() {
+		for _, name := range m.definedNames() {
+			p := m.loadStateFile().Processes[name]
+			if _, alive := m.liveStatus(p); alive || (p != nil && p.ExplicitlyStopped) {
+				continue
+			}
+			if pid, err := m.startProcess(name, p, false); err != nil {
+				results[name] = err.Error()
+			} else {
+				results[name] = fmt.Sprintf("pid %d", pid)
+			}
 		}
-	}
+	})
 	return results
 }
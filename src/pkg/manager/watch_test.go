@@ -6,6 +6,7 @@ import (
 )
 
 func TestWatchTickRestartsDeadProcess(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "sleeper", "sleep 300", nil)
 	first, err := m.StartProcess("sleeper")
@@ -13,7 +14,7 @@ func TestWatchTickRestartsDeadProcess(t *testing.T) {
 		t.Fatalf("start: %v", err)
 	}
 	killGroup(t, first)
-	if !waitForProcessDeath(first, SigtermTimeout) {
+	if !m.waitForProcessDeath(first, SigtermTimeout) {
 		t.Fatalf("pid %d did not die", first)
 	}
 	m.WatchTick()
@@ -25,6 +26,7 @@ func TestWatchTickRestartsDeadProcess(t *testing.T) {
 }
 
 func TestStartAllStartsEverything(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "a", "sleep 300", nil)
 	mustAdd(t, m, "b", "sleep 300", nil)
@@ -42,6 +44,7 @@ func TestStartAllStartsEverything(t *testing.T) {
 }
 
 func TestRestartDeadSkipsExplicitlyStopped(t *testing.T) {
+	t.Parallel()
 	m := newTestManager(t)
 	mustAdd(t, m, "live", "sleep 300", nil)
 	mustAdd(t, m, "halted", "sleep 300", nil)
@@ -66,3 +69,30 @@ func killGroup(t *testing.T, pid int) {
 	}
 	_ = syscall.Kill(-pgid, syscall.SIGKILL)
 }
+
+// TestRestartDeadCountsOneAttemptEitherWay pins that folding the attempt into
+// the start claim still counts exactly one attempt per restart, including one
+// that fails before it can claim the start.
+func TestRestartDeadCountsOneAttemptEitherWay(t *testing.T) {
+	t.Parallel()
+	m := newTestManager(t)
+	mustAdd(t, m, "svc", "sleep 300", nil)
+	if !m.restartDead("svc", m.loadStateFile().Processes["svc"]) {
+		t.Fatal("restartDead of a dead service did not start it")
+	}
+	pid, _ := m.processStatus("svc")
+	killGroup(t, pid)
+	if got := m.loadStateFile().Processes["svc"].RestartAttempt; got != 1 {
+		t.Fatalf("RestartAttempt after a successful restart = %d, want 1", got)
+	}
+	mustAdd(t, m, "claimed", "sleep 300", nil)
+	if !m.claimStartCounting("claimed", false) {
+		t.Fatal("claimStartCounting failed")
+	}
+	if m.restartDead("claimed", m.loadStateFile().Processes["claimed"]) {
+		t.Fatal("restartDead started a service with a live start claim")
+	}
+	if got := m.loadStateFile().Processes["claimed"].RestartAttempt; got != 1 {
+		t.Fatalf("RestartAttempt after a failed restart = %d, want 1", got)
+	}
+}